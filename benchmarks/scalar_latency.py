@@ -0,0 +1,83 @@
+"""
+Single-contract latency: NSEOption (SciPy/NumPy) vs FastNSEOption (math).
+
+Usage:
+    python benchmarks/scalar_latency.py [--number N]
+
+Exits non-zero if the two paths disagree by more than 1e-12 (relative
+to max(1, |value|)) on a grid of contracts, or on NaN-ness for the
+degenerate T <= 0 / sigma == 0 cases.
+"""
+import argparse
+import itertools
+import math
+import sys
+import timeit
+
+from qfinindia.options.black_scholes import NSEOption, FastNSEOption
+
+
+METHODS = [
+    "call_price", "put_price", "call_delta", "put_delta",
+    "gamma", "vega", "call_theta", "put_theta",
+]
+
+TOLERANCE = 1e-12
+
+# expiry day, expired and zero-vol contracts
+DEGENERATE = [
+    (22500.0, k, 0.065, sigma, t)
+    for k in (22000.0, 22500.0, 23000.0)
+    for sigma, t in ((0.18, 0.0), (0.18, -1 / 365), (0.0, 0.1), (0.0, 0.0))
+]
+
+
+def agreement():
+    spots = [22500.0]
+    strikes = [15000.0, 20000.0, 22000.0, 22500.0, 23000.0, 26000.0, 32000.0]
+    rates = [0.0, 0.065]
+    vols = [0.05, 0.18, 0.6]
+    times = [1 / 365, 7 / 365, 0.1, 1.0]
+
+    grid = itertools.product(spots, strikes, rates, vols, times)
+
+    worst = 0.0
+    for args in itertools.chain(grid, DEGENERATE):
+        ref = NSEOption(*args)
+        fast = FastNSEOption(*args)
+        for m in METHODS:
+            a = float(getattr(ref, m)())
+            b = getattr(fast, m)()
+            if math.isnan(a) or math.isnan(b):
+                if not (math.isnan(a) and math.isnan(b)):
+                    return math.inf
+                continue
+            worst = max(worst, abs(a - b) / max(1.0, abs(a)))
+    return worst
+
+
+def latency(cls, method, number):
+    opt = cls(22500.0, 22600.0, 0.065, 0.18, 0.1)
+    fn = getattr(opt, method)
+    best = min(timeit.repeat(fn, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    print(f"{'method':<12} {'scipy us':>10} {'math us':>10} {'speedup':>8}")
+    for m in METHODS:
+        slow = latency(NSEOption, m, args.number)
+        fast = latency(FastNSEOption, m, args.number)
+        print(f"{m:<12} {slow:>10.3f} {fast:>10.3f} {slow / fast:>7.1f}x")
+
+    worst = agreement()
+    print(f"\nmax relative difference: {worst:.3e} (tolerance {TOLERANCE:g})")
+    return 0 if worst <= TOLERANCE else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Benchmark suite for pricing, chain and density paths with regression checks.
+
+Usage:
+    python benchmarks/suite.py run [--preset quick|full] [--output FILE]
+                                   [--filter TEXT] [--repeat N]
+    python benchmarks/suite.py compare BASE.json NEW.json [--threshold 0.10]
+
+`run` times every case on SyntheticChain data (50 -> 50k strikes,
+1 -> 20 expiries) and writes JSON. `compare` prints the per-case ratio
+of best times and exits non-zero if any case is slower than BASE by
+more than the threshold.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from qfinindia import OptionChain, SyntheticChain, generate_report
+from qfinindia.options import NSEOption, greeks_chain, price_chain
+from qfinindia.options.batch import implied_vol_chain
+from qfinindia.volatility.distribution import Distribution
+from qfinindia.volatility.rnd import RND
+from qfinindia.volatility.tailrisk import TailRisk
+
+
+SPOT = 22500.0
+RATE = 0.065
+TIMESTAMP = pd.Timestamp("2026-01-05 15:30")
+
+# (strikes per expiry, expiries)
+PRESETS = {
+    "quick": [(50, 1), (500, 5)],
+    "full": [(50, 1), (500, 1), (5000, 1), (50000, 1),
+             (500, 5), (500, 20), (5000, 20)],
+}
+
+
+# ---------- data ----------
+
+def make_chain(n_strikes, n_expiries):
+    """
+    Multi-expiry SyntheticChain with n_strikes strikes per expiry.
+    """
+    lo, hi = 0.6 * SPOT, 1.4 * SPOT
+    step = (hi - lo) / (n_strikes - 1)
+
+    frames = []
+    for i in range(n_expiries):
+        days = 7 * (i + 1)
+        expiry = TIMESTAMP.normalize() + pd.Timedelta(days=days)
+        sc = SyntheticChain(
+            SPOT, expiry, strike_range=(lo, hi - step / 2, step),
+            r=RATE, T=days / 365,
+        )
+        frames.append(sc.build().data)
+
+    return OptionChain.from_dataframe(
+        pd.concat(frames, ignore_index=True),
+        underlying=SPOT, timestamp=TIMESTAMP,
+    )
+
+
+# ---------- cases ----------
+
+def scalar_cases():
+    opt = NSEOption(SPOT, 22600.0, RATE, 0.18, 0.1)
+    price = opt.call_price()
+    return {
+        "nseoption.call_price": opt.call_price,
+        "nseoption.gamma": opt.gamma,
+        "nseoption.vega": opt.vega,
+        "nseoption.implied_volatility": lambda: NSEOption(
+            SPOT, 22600.0, RATE, 0.18, 0.1
+        ).implied_volatility(price),
+    }
+
+
+def chain_cases(chain):
+    df = chain.data.sample(frac=1.0, random_state=0)
+    expiries = chain.expiries()
+    first = expiries[0]
+
+    rnd = RND.from_chain(chain, first)
+    x, f = rnd.strikes, rnd.density
+    alphas = np.array([0.01, 0.05])
+
+    def slices():
+        chain.clear_cache()  # time the index path, not the memo
+        for e in expiries:
+            chain.calls(e)
+            chain.puts(e)
+
+    return {
+        "chain.from_dataframe": lambda: OptionChain.from_dataframe(
+            df, underlying=SPOT, timestamp=TIMESTAMP
+        ),
+        "chain.slice": slices,
+        "options.price_chain": lambda: price_chain(chain, RATE),
+        "options.greeks_chain": lambda: greeks_chain(chain, RATE),
+        "options.implied_vol_chain": lambda: implied_vol_chain(chain, RATE),
+        "rnd.from_chain": lambda: RND.from_chain(chain, first),
+        "distribution.moments": lambda: Distribution(x, f).moments(),
+        "tailrisk.var": lambda: TailRisk(x, f).var(alphas),
+        "generate_report": lambda: generate_report(chain, output="dict"),
+    }
+
+
+def measure(fn, repeat):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "best": min(times),
+        "median": statistics.median(times),
+        "number": number,
+    }
+
+
+# ---------- commands ----------
+
+def run(args):
+    results = {}
+
+    def record(name, strikes, expiries, fn):
+        key = name if strikes is None else \
+            f"{name}[strikes={strikes},expiries={expiries}]"
+        if args.filter and args.filter not in key:
+            return
+        stats = measure(fn, args.repeat)
+        results[key] = {"case": name, "strikes": strikes,
+                        "expiries": expiries, **stats}
+        print(f"{key:<62} {stats['best'] * 1e6:>14.2f} us")
+
+    for name, fn in scalar_cases().items():
+        record(name, None, None, fn)
+
+    for strikes, expiries in PRESETS[args.preset]:
+        chain = make_chain(strikes, expiries)
+        for name, fn in chain_cases(chain).items():
+            record(name, strikes, expiries, fn)
+
+    payload = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "preset": args.preset,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(payload, f, indent=2)
+    print(f"\nwrote {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args):
+    with open(args.base) as f:
+        base = json.load(f)["results"]
+    with open(args.new) as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'case':<62} {'base us':>12} {'new us':>12} {'ratio':>7}")
+    for key in sorted(set(base) & set(new)):
+        a, b = base[key]["best"], new[key]["best"]
+        ratio = b / a
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{key:<62} {a * 1e6:>12.2f} {b * 1e6:>12.2f} "
+              f"{ratio:>6.2f}x{flag}")
+
+    for key in sorted(set(base) ^ set(new)):
+        print(f"{key:<62} only in {'base' if key in base else 'new'}")
+
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="time all cases and write JSON")
+    p.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    p.add_argument("--output", default="benchmark_results.json")
+    p.add_argument("--filter", default=None,
+                   help="only cases whose key contains this text")
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=run)
+
+    p = sub.add_parser("compare", help="flag regressions between runs")
+    p.add_argument("base")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=0.10,
+                   help="allowed slowdown as a fraction (default 0.10)")
+    p.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
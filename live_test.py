@@ -10,7 +10,7 @@ from qfinindia.volatility.vol_metrics import VolMetrics
 from qfinindia.report import generate_report
 
 # Load NSE snapshot
-with open("data/nifty_option_chain.json") as f:
+with open("qfinindia/data/nifty_option_chain.json") as f:
     raw = json.load(f)
 
 # Universal chain
@@ -45,7 +45,7 @@ print("VaR 1%:", tail.var(0.01))
 print("Downside prob:", tail.downside_probability(chain.underlying))
 print("Upside prob:", tail.upside_probability(chain.underlying))
 
-mi = MarketIntelligence.from_metrics(chain, dist, tail)
+mi = MarketIntelligence.from_metrics(chain, dist, tail, expiry="2026-03-27")
 
 print(mi.summary())
 
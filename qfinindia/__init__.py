@@ -1,8 +1,7 @@
 from .market.option_chain import OptionChain
-from .report import generate_report
+from .report import generate_report, generate_reports
 from .synthetic import SyntheticChain
 from .analytics import Analytics
 from .plotting import plot_smile, plot_rnd, plot_distribution
-from .report import generate_report
 
-__all__ = ["OptionChain", "generate_report"]
+__all__ = ["OptionChain", "generate_report", "generate_reports"]
@@ -1,26 +1,36 @@
-from qfinindia.volatility.rnd import RND
-from qfinindia.volatility.distribution import Distribution
-from qfinindia.volatility.tailrisk import TailRisk
-from qfinindia.volatility.vol_metrics import VolMetrics
+from qfinindia.context import AnalyticsContext
 
 
 class Analytics:
     """
     Unified analytics interface for option chains.
+
+    Intermediate objects come from a shared AnalyticsContext, so each
+    is built once per chain version; pass `context` to share it.
     """
 
-    def __init__(self, chain, expiry=None):
+    def __init__(self, chain, expiry=None, context=None):
         self.chain = chain
+        self.context = context if context is not None \
+            else AnalyticsContext(chain)
+        self.expiry = self.context.resolve_expiry(expiry)
+
+    # ---- graph nodes ----
+    @property
+    def rnd(self):
+        return self.context.rnd(self.expiry)
 
-        if expiry is None:
-            expiry = chain.expiries()[0]
+    @property
+    def dist(self):
+        return self.context.distribution(self.expiry)
 
-        self.expiry = expiry
+    @property
+    def tail(self):
+        return self.context.tail(self.expiry)
 
-        self.rnd = RND.from_chain(chain, expiry)
-        self.dist = Distribution.from_rnd(self.rnd)
-        self.tail = TailRisk.from_distribution(self.dist)
-        self.vm = VolMetrics(chain)
+    @property
+    def vm(self):
+        return self.context.vol_metrics(self.expiry)
 
     # ---- core metrics ----
     @property
@@ -29,7 +39,7 @@ class Analytics:
 
     @property
     def forward(self):
-        return self.dist.mean()
+        return self.context.forward(self.expiry)
 
     @property
     def expected_move(self):
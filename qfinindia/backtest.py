@@ -0,0 +1,183 @@
+import csv
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from qfinindia.data.store import _exchange_time
+from qfinindia.report import METRIC_COLUMNS, _cvar_column, _snapshot_rows
+
+
+CVAR_ALPHAS = (0.05, 0.01)
+
+BACKTEST_COLUMNS = ["timestamp", "expiry"] + METRIC_COLUMNS + \
+    [_cvar_column(alpha) for alpha in CVAR_ALPHAS] + ["error"]
+
+
+def _last_timestamp(path):
+    """
+    Timestamp of the last complete row of a checkpoint CSV, dropping a
+    trailing partial line left by an interrupted write.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+
+    with open(path, "rb+") as f:
+        header = f.readline()
+        col = header.decode().rstrip("\r\n").split(",").index("timestamp")
+
+        size = f.seek(0, os.SEEK_END)
+        block = 4096
+        while True:
+            start = max(len(header), size - block)
+            f.seek(start)
+            tail = f.read(size - start)
+            if tail.count(b"\n") >= 2 or start == len(header):
+                break
+            block *= 2
+
+        if tail and not tail.endswith(b"\n"):
+            cut = tail.rfind(b"\n") + 1
+            f.truncate(start + cut)
+            tail = tail[:cut]
+
+        lines = tail.splitlines()
+        if not lines:
+            return None
+        value = next(csv.reader([lines[-1].decode()]))[col]
+        return pd.Timestamp(value)
+
+
+class BacktestRunner:
+    """
+    Historical metric series from a SnapshotStore, one day at a time.
+
+    Each stored snapshot is read through memory-mapped columns, the
+    Analytics metric set (plus CVaR) is computed for every expiry, and
+    rows are appended to a CSV checkpoint every `chunk` snapshots. Only
+    one day's partitions and one chunk of rows are alive at a time, so
+    memory stays flat over any history length. Re-running with the
+    same output resumes after the last written snapshot.
+    """
+
+    def __init__(self, store, underlying, output, start=None, end=None,
+                 expiry=None, chunk=64, progress=None, progress_every=5.0,
+                 **rnd_options):
+        """
+        progress(stats) is called about every progress_every seconds
+        with snapshots, rows, seconds and snapshots_per_sec.
+        """
+        self.store = store
+        self.underlying = underlying
+        self.output = output
+        self.start = None if start is None else _exchange_time(start)
+        self.end = None if end is None else _exchange_time(end)
+        self.expiry = expiry
+        self.chunk = chunk
+        self.progress = progress
+        self.progress_every = progress_every
+        self.rnd_options = rnd_options
+
+    def _snapshots(self, resume):
+        """
+        Stored chains after `resume`, read one day at a time.
+        """
+        lo = self.start
+        if resume is not None:
+            after = resume + pd.Timedelta(1, "ns")
+            lo = after if lo is None else max(lo, after)
+
+        for date in self.store.dates(self.underlying):
+            day = pd.Timestamp(date)
+            day_end = day + pd.Timedelta(1, "D") - pd.Timedelta(1, "ns")
+            if lo is not None and day_end < lo:
+                continue
+            if self.end is not None and day > self.end:
+                break
+
+            yield from self.store.read(
+                self.underlying,
+                start=day if lo is None else max(day, lo),
+                end=day_end if self.end is None else min(day_end, self.end),
+                expiry=self.expiry,
+            )
+
+    def _write(self, rows):
+        header = not os.path.exists(self.output) or \
+            os.path.getsize(self.output) == 0
+
+        buf = io.StringIO()
+        pd.DataFrame(rows, columns=BACKTEST_COLUMNS).to_csv(
+            buf, header=header, index=False
+        )
+        with open(self.output, "a", newline="") as f:
+            f.write(buf.getvalue())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def run(self):
+        """
+        Process every pending snapshot.
+
+        Returns
+        -------
+        dict
+            snapshots, rows, seconds, snapshots_per_sec and resumed_from.
+        """
+        resume = _last_timestamp(self.output)
+
+        started = last_report = time.perf_counter()
+        snapshots = rows_written = 0
+        rows = []
+        pending = 0
+
+        def stats():
+            seconds = time.perf_counter() - started
+            return {
+                "snapshots": snapshots,
+                "rows": rows_written + len(rows),
+                "seconds": seconds,
+                "snapshots_per_sec": snapshots / seconds if seconds else np.nan,
+                "resumed_from": resume,
+            }
+
+        metrics = BACKTEST_COLUMNS[2:-1]
+        for chain in self._snapshots(resume):
+            for ts, expiry, m, error in _snapshot_rows(
+                chain, cvar=CVAR_ALPHAS, **self.rnd_options
+            ):
+                values = [np.nan] * len(metrics) if m is None else \
+                    [m[name] for name in metrics]
+                rows.append((ts, expiry, *values, error))
+            snapshots += 1
+            pending += 1
+
+            if pending >= self.chunk:
+                self._write(rows)
+                rows_written += len(rows)
+                rows, pending = [], 0
+
+            now = time.perf_counter()
+            if self.progress is not None and \
+                    now - last_report >= self.progress_every:
+                last_report = now
+                self.progress(stats())
+
+        if rows:
+            self._write(rows)
+            rows_written += len(rows)
+            rows = []
+
+        result = stats()
+        if self.progress is not None:
+            self.progress(result)
+        return result
+
+    def results(self):
+        """
+        The checkpoint CSV as a DataFrame indexed by (timestamp, expiry).
+        """
+        df = pd.read_csv(self.output, parse_dates=["timestamp", "expiry"])
+        return df.set_index(["timestamp", "expiry"])
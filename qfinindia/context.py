@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+from qfinindia.market.parity import parity_forwards
+from qfinindia.volatility.rnd import RND
+from qfinindia.volatility.distribution import Distribution
+from qfinindia.volatility.tailrisk import TailRisk
+
+
+class AnalyticsContext:
+    """
+    Lazily evaluated, memoized analytics graph over one chain.
+
+    Each node (RND, distribution, tail, forward, vol metrics) is built at
+    most once per (expiry, option type) and chain expiry version, and the
+    chain-wide parity table once per chain version, so
+    OptionChain.apply_updates only forces dirty expiries to rebuild.
+    """
+
+    def __init__(self, chain, **rnd_options):
+        """
+        rnd_options are passed to RND.from_chain (grid policy, n, tol),
+        e.g. a coarse grid intraday and a fine one end of day.
+        """
+        self.chain = chain
+        self.rnd_options = rnd_options
+        self._cache = {}
+
+    # ---------- cache ----------
+
+    def resolve_expiry(self, expiry=None):
+        if expiry is None:
+            return self.chain.expiries()[0]
+        return pd.Timestamp(expiry)
+
+    def _memo(self, name, expiry, option_type, build):
+        """
+        expiry=None marks a chain-wide node, keyed on chain.version.
+        """
+        key = (name, expiry, option_type)
+        version = self.chain.version if expiry is None \
+            else self.chain.expiry_version(expiry)
+
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+
+        value = build()
+        self._cache[key] = (version, value)
+        return value
+
+    def invalidate(self, expiry=None):
+        """
+        Drop cached nodes for one expiry, or everything.
+        """
+        if expiry is None:
+            self._cache.clear()
+            return
+
+        expiry = pd.Timestamp(expiry)
+        self._cache = {
+            k: v for k, v in self._cache.items()
+            if k[1] is not None and k[1] != expiry
+        }
+
+    # ---------- nodes ----------
+
+    def rnd(self, expiry=None, option_type="C"):
+        expiry = self.resolve_expiry(expiry)
+        return self._memo(
+            "rnd", expiry, option_type,
+            lambda: RND.from_chain(
+                self.chain, expiry, option_type, **self.rnd_options
+            ),
+        )
+
+    def distribution(self, expiry=None, option_type="C"):
+        expiry = self.resolve_expiry(expiry)
+        return self._memo(
+            "distribution", expiry, option_type,
+            lambda: Distribution.from_rnd(self.rnd(expiry, option_type)),
+        )
+
+    def tail(self, expiry=None, option_type="C"):
+        expiry = self.resolve_expiry(expiry)
+        return self._memo(
+            "tail", expiry, option_type,
+            lambda: TailRisk.from_distribution(
+                self.distribution(expiry, option_type)
+            ),
+        )
+
+    def parity(self):
+        """
+        Put-call parity forward/discount for every expiry at once.
+        """
+        return self._memo("parity", None, None,
+                          lambda: parity_forwards(self.chain))
+
+    def forward(self, expiry=None, option_type="C"):
+        """
+        Parity forward; falls back to the RND mean when the expiry has
+        no usable call/put pairs (or no price column).
+        """
+        expiry = self.resolve_expiry(expiry)
+
+        def build():
+            if "price" in self.chain.data.columns:
+                fwd = self.parity()["forward"].get(expiry, np.nan)
+                if np.isfinite(fwd):
+                    return float(fwd)
+            return self.distribution(expiry, option_type).mean()
+
+        return self._memo("forward", expiry, option_type, build)
+
+    def vol_metrics(self, expiry=None):
+        from qfinindia.volatility.vol_metrics import VolMetrics
+
+        expiry = self.resolve_expiry(expiry)
+        return self._memo(
+            "vol_metrics", expiry, None,
+            lambda: VolMetrics(self.chain, expiry, context=self),
+        )
@@ -0,0 +1,3 @@
+from .nse import parse_nse_chain, load_nse_chain, parse_nse_directory
+from .store import SnapshotStore
+from .live import LivePoller, CoalescingQueue
@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import os
+from glob import glob
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeFeedServer:
+    """
+    Local HTTP/1.1 stand-in for the NSE option-chain endpoint.
+
+    Replays archived JSON payloads per symbol in order, on any path with
+    a `symbol` query parameter, over keep-alive connections. The last
+    payload repeats once the archive is exhausted (loop=True starts over).
+
+        server = FakeFeedServer({"NIFTY": ["a.json", "b.json"]})
+        await server.start()
+        LivePoller(server.url, ["NIFTY"])
+    """
+
+    def __init__(self, sources, host="127.0.0.1", port=0, loop=False):
+        self.payloads = {}
+        for symbol, paths in sources.items():
+            paths = [paths] if isinstance(paths, str) else list(paths)
+            if not paths:
+                raise ValueError(f"No payloads for {symbol!r}")
+            self.payloads[symbol] = [_read(p) for p in paths]
+
+        self.host = host
+        self.port = port
+        self.loop = loop
+        self.requests = 0
+        self.connections = 0
+        self._cursor = {s: 0 for s in self.payloads}
+        self._server = None
+        self._writers = set()
+
+    @classmethod
+    def from_directory(cls, directory, pattern="*.json", **kwargs):
+        """
+        One subdirectory of payload files per symbol.
+        """
+        sources = {}
+        for symbol in sorted(os.listdir(directory)):
+            files = sorted(glob(os.path.join(directory, symbol, pattern)))
+            if files:
+                sources[symbol] = files
+        return cls(sources, **kwargs)
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def _next(self, symbol):
+        items = self.payloads[symbol]
+        i = self._cursor[symbol]
+        if i >= len(items):
+            i = 0 if self.loop else len(items) - 1
+        self._cursor[symbol] = i + 1
+        return items[i]
+
+    # ---------- server ----------
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            # wait_closed() waits for open keep-alive clients as well
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+
+                keep_alive = True
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "connection":
+                        keep_alive = value.strip().lower() != "close"
+
+                self.requests += 1
+                target = request.decode("latin-1").split()[1]
+                symbol = parse_qs(urlsplit(target).query).get("symbol", [None])[0]
+
+                if symbol in self.payloads:
+                    status, body = "200 OK", self._next(symbol)
+                else:
+                    status, body = "404 Not Found", b'{"error": "unknown symbol"}'
+
+                writer.write((
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n"
+                ).encode("latin-1") + body)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError,
+                asyncio.CancelledError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Replay archived NSE option-chain JSON over HTTP."
+    )
+    parser.add_argument("directory", help="one subdirectory per symbol")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--loop", action="store_true",
+                        help="restart each archive when exhausted")
+    args = parser.parse_args(argv)
+
+    server = FakeFeedServer.from_directory(
+        args.directory, host=args.host, port=args.port, loop=args.loop
+    )
+
+    async def serve():
+        await server.start()
+        print(f"Serving {sorted(server.payloads)} on {server.url}")
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
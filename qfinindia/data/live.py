@@ -0,0 +1,294 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+from qfinindia.market.option_chain import OptionChain
+
+
+NSE_PATH = "/api/option-chain-indices?symbol={symbol}"
+
+
+def parse_snapshot(body: bytes):
+    """
+    Parse one raw NSE payload into an OptionChain (runs in a worker).
+    """
+    return OptionChain.from_nse(json.loads(body))
+
+
+# ---------- HTTP ----------
+
+class HTTPError(Exception):
+    """
+    Non-200 response; the connection stays open for the next request.
+    """
+
+    def __init__(self, status, path, body=b""):
+        super().__init__(f"HTTP {status} for {path}")
+        self.status = status
+        self.path = path
+        self.body = body
+
+
+class KeepAliveClient:
+    """
+    Minimal asyncio HTTP/1.1 GET client that keeps one connection open
+    across requests and reconnects once if the server dropped it.
+    Non-200 responses raise HTTPError without dropping the connection.
+    """
+
+    def __init__(self, host, port, ssl=False, timeout=10.0, headers=None):
+        self.host = host
+        self.port = port
+        self.ssl = ssl
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.connections = 0
+        self._reader = None
+        self._writer = None
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl or None
+        )
+        self.connections += 1
+
+    async def close(self):
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def get(self, path) -> bytes:
+        for attempt in range(2):
+            if self._writer is None:
+                await self._connect()
+            try:
+                return await asyncio.wait_for(
+                    self._roundtrip(path), self.timeout
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # stale keep-alive socket: retry once on a fresh one
+                await self.close()
+                if attempt:
+                    raise
+            except HTTPError:
+                raise
+            except BaseException:
+                await self.close()
+                raise
+
+    async def _roundtrip(self, path) -> bytes:
+        headers = {
+            "Host": self.host,
+            "Connection": "keep-alive",
+            "Accept": "application/json",
+            "Accept-Encoding": "identity",
+            **self.headers,
+        }
+        head = f"GET {path} HTTP/1.1\r\n" + "".join(
+            f"{k}: {v}\r\n" for k, v in headers.items()
+        ) + "\r\n"
+        self._writer.write(head.encode("latin-1"))
+        await self._writer.drain()
+
+        reader = self._reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        parts = status_line.decode("latin-1").split(None, 2)
+        status = int(parts[1])
+
+        fields = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            fields[name.strip().lower()] = value.strip()
+
+        if fields.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked()
+        elif "content-length" in fields:
+            body = await reader.readexactly(int(fields["content-length"]))
+        else:
+            body = await reader.read()
+            fields["connection"] = "close"
+
+        if fields.get("connection", "").lower() == "close":
+            await self.close()
+
+        if status != 200:
+            raise HTTPError(status, path, body)
+        return body
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self._reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # trailers end with a blank line
+                while (await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readexactly(2)
+
+
+# ---------- queue ----------
+
+class CoalescingQueue:
+    """
+    Bounded asyncio queue holding at most one pending item per key.
+
+    Putting a key that is already waiting replaces the stale item in
+    place (counted in `coalesced`); new keys block while the queue is
+    full, which pushes back on the pollers.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.coalesced = 0
+        self._items = {}
+        self._cond = asyncio.Condition()
+
+    def qsize(self):
+        return len(self._items)
+
+    def _has_room(self):
+        return not self.maxsize or len(self._items) < self.maxsize
+
+    async def put(self, key, item):
+        async with self._cond:
+            await self._cond.wait_for(
+                lambda: key in self._items or self._has_room()
+            )
+            if key in self._items:
+                self.coalesced += 1
+            self._items[key] = item
+            self._cond.notify_all()
+
+    async def get(self):
+        """
+        Oldest pending (key, item).
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._items)
+            key = next(iter(self._items))
+            item = self._items.pop(key)
+            self._cond.notify_all()
+            return key, item
+
+
+# ---------- poller ----------
+
+class LivePoller:
+    """
+    Polls an option-chain endpoint for several underlyings concurrently.
+
+    Each underlying keeps its own keep-alive connection; payloads are
+    parsed in a worker pool off the event loop and pushed into a
+    CoalescingQueue keyed by underlying. Only snapshots whose exchange
+    timestamp moved forward are queued.
+
+        async with LivePoller(url, ["NIFTY", "BANKNIFTY"]) as poller:
+            while True:
+                symbol, chain = await poller.queue.get()
+    """
+
+    def __init__(self, url, symbols, interval=3.0, path=NSE_PATH,
+                 queue=None, executor=None, timeout=10.0, headers=None):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError("url must be http:// or https://")
+
+        self.host = parts.hostname
+        self.ssl = parts.scheme == "https"
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.symbols = list(symbols)
+        self.interval = interval
+        self.path = path
+        self.queue = queue if queue is not None else \
+            CoalescingQueue(maxsize=len(self.symbols))
+        self.executor = executor
+        self.timeout = timeout
+        self.headers = headers
+
+        self.received = {s: 0 for s in self.symbols}
+        self.errors = {}
+        self.clients = {}
+        self._task = None
+
+    async def _poll(self, symbol, executor):
+        loop = asyncio.get_running_loop()
+        client = KeepAliveClient(
+            self.host, self.port, ssl=self.ssl,
+            timeout=self.timeout, headers=self.headers,
+        )
+        self.clients[symbol] = client
+        path = self.path.format(symbol=symbol)
+        last = None
+
+        try:
+            while True:
+                started = loop.time()
+                try:
+                    body = await client.get(path)
+                    chain = await loop.run_in_executor(
+                        executor, parse_snapshot, body
+                    )
+                    if chain.timestamp is None or last is None or \
+                            chain.timestamp > last:
+                        last = chain.timestamp
+                        self.received[symbol] += 1
+                        await self.queue.put(symbol, chain)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # keep polling; latest kept
+                    self.errors[symbol] = exc
+
+                elapsed = loop.time() - started
+                await asyncio.sleep(max(0.0, self.interval - elapsed))
+        finally:
+            await client.close()
+
+    async def run(self):
+        """
+        Poll until cancelled.
+        """
+        executor = self.executor
+        own = executor is None
+        if own:
+            executor = ProcessPoolExecutor(max_workers=len(self.symbols))
+        try:
+            await asyncio.gather(
+                *(self._poll(s, executor) for s in self.symbols)
+            )
+        finally:
+            if own:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
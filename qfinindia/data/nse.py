@@ -0,0 +1,143 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from qfinindia.market.option_chain import OptionChain, TYPE_DTYPE
+
+
+# output column -> key inside an NSE CE/PE leg
+LEG_FIELDS = {
+    "price": "lastPrice",
+    "bid": "bidprice",
+    "ask": "askPrice",
+    "iv": "impliedVolatility",
+    "oi": "openInterest",
+    "volume": "totalTradedVolume",
+}
+
+LEGS = (("CE", 0), ("PE", 1))
+
+
+def _parse_timestamp(value):
+    if not value:
+        return None
+    return pd.to_datetime(value, format="mixed", dayfirst=True)
+
+
+def parse_nse_chain(json_data: dict):
+    """
+    Parse an NSE option-chain payload into chain columns.
+
+    Walks `records.data` once, writing each CE/PE leg straight into
+    preallocated NumPy columns. Expiry strings are parsed once per
+    distinct value. IV is converted from percent to decimal; zero IV
+    (NSE's "no quote") becomes NaN.
+
+    Returns
+    -------
+    (pandas.DataFrame, float, pandas.Timestamp | None)
+    """
+    records = json_data["records"]
+    rows = records["data"]
+
+    n = 2 * len(rows)
+    strike = np.empty(n)
+    expiry_code = np.empty(n, dtype=np.int32)
+    type_code = np.empty(n, dtype=np.int8)
+    values = np.full((len(LEG_FIELDS), n), np.nan)
+    fields = tuple(enumerate(LEG_FIELDS.values()))
+
+    codes = {}
+    i = 0
+    for row in rows:
+        k = row["strikePrice"]
+        e = row["expiryDate"]
+        code = codes.get(e)
+        if code is None:
+            code = codes[e] = len(codes)
+
+        for leg, t in LEGS:
+            quote = row.get(leg)
+            if quote is None:
+                continue
+
+            strike[i] = k
+            expiry_code[i] = code
+            type_code[i] = t
+            for j, key in fields:
+                v = quote.get(key)
+                if v is not None:
+                    values[j, i] = v
+            i += 1
+
+    iv = values[list(LEG_FIELDS).index("iv"), :i]
+    iv[:] = np.where(iv > 0, iv / 100.0, np.nan)
+
+    expiries = pd.to_datetime(list(codes), format="mixed", dayfirst=True)
+
+    df = pd.DataFrame({
+        "type": pd.Categorical.from_codes(type_code[:i], dtype=TYPE_DTYPE),
+        "strike": strike[:i],
+        "expiry": expiries.to_numpy()[expiry_code[:i]],
+        **{name: values[j, :i] for j, name in enumerate(LEG_FIELDS)},
+    })
+
+    underlying = records.get("underlyingValue")
+    timestamp = _parse_timestamp(records.get("timestamp"))
+
+    return df, underlying, timestamp
+
+
+def load_nse_chain(path):
+    """
+    Read one archived NSE JSON snapshot into an OptionChain.
+    """
+    with open(path, "rb") as f:
+        raw = json.load(f)
+    return OptionChain.from_nse(raw)
+
+
+def _load_or_error(path):
+    try:
+        return load_nse_chain(path)
+    except Exception as exc:  # reported back to the parent per file
+        return exc
+
+
+def parse_nse_directory(directory, pattern="*.json", processes=None,
+                        chunksize=64, errors="raise"):
+    """
+    Parse every snapshot file in a directory with a process pool.
+
+    Yields (path, OptionChain) in sorted path order. With
+    errors="skip", files that fail to parse are left out. Files are
+    submitted a bounded window at a time, so memory stays flat and
+    stopping early (or an error) cancels the work not yet started.
+    """
+    if errors not in ("raise", "skip"):
+        raise ValueError("errors must be 'raise' or 'skip'")
+
+    paths = iter(sorted(glob(os.path.join(directory, pattern))))
+    workers = processes or os.cpu_count() or 1
+    window = chunksize * workers * 2
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            batch = list(islice(paths, window))
+            if not batch:
+                break
+            results = pool.map(_load_or_error, batch, chunksize=chunksize)
+            for path, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    if errors == "raise":
+                        raise ValueError(f"Failed to parse {path}") from result
+                    continue
+                yield path, result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
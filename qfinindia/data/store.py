@@ -0,0 +1,323 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from qfinindia.market.option_chain import OptionChain, TYPE_DTYPE
+
+
+SNAPSHOT_DTYPE = np.dtype([
+    ("ts", "<i8"),
+    ("start", "<i8"),
+    ("stop", "<i8"),
+    ("spot", "<f8"),
+])
+
+META_FILE = "meta.json"
+SNAPSHOT_FILE = "snapshots.bin"
+
+# snapshots are stored and returned as tz-naive exchange time
+EXCHANGE_TZ = "Asia/Kolkata"
+
+
+def _exchange_time(ts) -> pd.Timestamp:
+    """
+    ts as tz-naive IST; tz-aware stamps are converted first.
+    """
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(EXCHANGE_TZ).tz_localize(None)
+    return ts
+
+
+def _date_key(ts) -> str:
+    return pd.Timestamp(ts).strftime("%Y-%m-%d")
+
+
+def _memmap(path, dtype, mode="r"):
+    dtype = np.dtype(dtype)
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode)
+
+
+class _Partition:
+    """
+    One underlying/date/expiry directory of append-only column files.
+
+    Each column lives in <name>.bin as raw little-endian values; type is
+    stored as int8 C/P codes. snapshots.bin holds one SNAPSHOT_DTYPE
+    record per appended snapshot with its row range.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._meta = None
+        self._columns = None
+
+    @property
+    def meta(self):
+        if self._meta is None:
+            with open(os.path.join(self.path, META_FILE)) as f:
+                self._meta = json.load(f)
+        return self._meta
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f"{name}.bin")
+
+    def snapshots(self):
+        return _memmap(os.path.join(self.path, SNAPSHOT_FILE), SNAPSHOT_DTYPE)
+
+    def columns(self):
+        """
+        Copy-on-write column maps: writes (e.g. apply_updates on a chain
+        read from the store) land in private pages, never in the files.
+        """
+        if self._columns is None:
+            self._columns = {
+                name: _memmap(self._column_path(name), dtype, mode="c")
+                for name, dtype in self.meta["columns"].items()
+            }
+        return dict(self._columns)
+
+    def append(self, df, ts, spot):
+        os.makedirs(self.path, exist_ok=True)
+        meta_path = os.path.join(self.path, META_FILE)
+
+        cols = {"type": (df["type"] == "P").to_numpy().astype(np.int8)}
+        for name in df.columns:
+            if name in ("type", "expiry"):
+                continue
+            values = df[name].to_numpy()
+            if values.dtype.kind not in "biuf":
+                raise ValueError(f"Column {name!r} is not numeric")
+            cols[name] = values
+
+        if os.path.exists(meta_path):
+            schema = self.meta["columns"]
+            if set(schema) != set(cols):
+                raise ValueError(
+                    f"Columns {sorted(cols)} do not match partition "
+                    f"schema {sorted(schema)}"
+                )
+        else:
+            schema = {name: v.dtype.str for name, v in cols.items()}
+            with open(meta_path, "w") as f:
+                json.dump({"columns": schema}, f)
+            self._meta = {"columns": schema}
+
+        snaps = self._committed_snapshots()
+        start = int(snaps["stop"][-1]) if len(snaps) else 0
+        if len(snaps) and ts <= snaps["ts"][-1]:
+            raise ValueError(
+                "Snapshots must be appended in increasing timestamp order"
+            )
+
+        # drop rows an interrupted append left past the last record, so
+        # every column file ends exactly at `start`
+        self._columns = None
+        for name, dtype in schema.items():
+            path = self._column_path(name)
+            expected = start * np.dtype(dtype).itemsize
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if size < expected:
+                raise ValueError(
+                    f"Column file {path} is shorter than its snapshot index"
+                )
+            with open(path, "ab") as f:
+                if size > expected:
+                    f.truncate(expected)
+                np.ascontiguousarray(cols[name], dtype=dtype).tofile(f)
+
+        # the snapshot record goes last: it is what makes the rows visible
+        record = np.array([(ts, start, start + len(df), spot)],
+                          dtype=SNAPSHOT_DTYPE)
+        with open(os.path.join(self.path, SNAPSHOT_FILE), "ab") as f:
+            record.tofile(f)
+
+    def last_timestamp(self):
+        """
+        Stored ts (ns) of the last complete snapshot record, or None.
+        """
+        snaps = self.snapshots()
+        return int(snaps["ts"][-1]) if len(snaps) else None
+
+    def _committed_snapshots(self):
+        """
+        Snapshot records, dropping a torn trailing record first.
+        """
+        path = os.path.join(self.path, SNAPSHOT_FILE)
+        if os.path.exists(path):
+            size = os.path.getsize(path)
+            extra = size % SNAPSHOT_DTYPE.itemsize
+            if extra:
+                with open(path, "ab") as f:
+                    f.truncate(size - extra)
+        return np.array(self.snapshots())
+
+
+class SnapshotStore:
+    """
+    On-disk store of historical chains, partitioned as
+
+        root/<underlying>/<YYYY-MM-DD>/<expiry YYYY-MM-DD>/
+
+    Partitions are raw binary columns that are memory-mapped on read, so
+    single-expiry chains come back as views over the mapped files.
+    Timestamps are kept as tz-naive IST; <YYYY-MM-DD> is the IST date.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    # ---------- layout ----------
+
+    def _partition(self, underlying, date, expiry):
+        return _Partition(os.path.join(
+            self.root, underlying, date, _date_key(expiry)
+        ))
+
+    @staticmethod
+    def _listdir(path):
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            d for d in os.listdir(path)
+            if os.path.isdir(os.path.join(path, d))
+        )
+
+    def underlyings(self):
+        return self._listdir(self.root)
+
+    def dates(self, underlying):
+        return self._listdir(os.path.join(self.root, underlying))
+
+    # ---------- write ----------
+
+    def append(self, chain, underlying, timestamp=None):
+        """
+        Append one snapshot, split into one partition per expiry.
+
+        Timestamps are stored as tz-naive IST (aware ones are converted)
+        and must increase per partition; a repeat raises ValueError.
+        """
+        ts = timestamp if timestamp is not None else chain.timestamp
+        if ts is None:
+            raise ValueError("timestamp is required to store a snapshot")
+        ts = _exchange_time(ts)
+
+        spot = np.nan if chain.underlying is None else float(chain.underlying)
+        date = _date_key(ts)
+
+        parts = {e: self._partition(underlying, date, e)
+                 for e in chain.expiries()}
+
+        # check every partition before writing any, so a stale or repeated
+        # snapshot is rejected whole
+        for part in parts.values():
+            last = part.last_timestamp()
+            if last is not None and ts.value <= last:
+                raise ValueError(
+                    f"Snapshot at {ts} is not after the last stored one "
+                    f"({pd.Timestamp(last)})"
+                )
+
+        for expiry, part in parts.items():
+            part.append(chain.expiry(expiry).data, ts.value, spot)
+
+    # ---------- read ----------
+
+    def _selected(self, underlying, start, end, expiry):
+        """
+        Per stored date, the (ts, spot, expiry, partition, row start,
+        row stop) of every selected slice, sorted by (ts, expiry).
+        Dates are walked lazily, one at a time.
+        """
+        lo = _exchange_time(start).value if start is not None else None
+        hi = _exchange_time(end).value if end is not None else None
+        wanted = None if expiry is None else {
+            _date_key(e) for e in pd.to_datetime(np.atleast_1d(expiry))
+        }
+
+        for date in self.dates(underlying):
+            if lo is not None and date < _date_key(lo):
+                continue
+            if hi is not None and date > _date_key(hi):
+                break
+
+            out = []
+            day = os.path.join(self.root, underlying, date)
+            for exp in self._listdir(day):
+                if wanted is not None and exp not in wanted:
+                    continue
+
+                part = _Partition(os.path.join(day, exp))
+                snaps = part.snapshots()
+                ts = snaps["ts"]
+                i = 0 if lo is None else np.searchsorted(ts, lo, "left")
+                j = len(ts) if hi is None else np.searchsorted(ts, hi, "right")
+                for rec in snaps[i:j]:
+                    out.append((int(rec["ts"]), float(rec["spot"]), exp,
+                                part, int(rec["start"]), int(rec["stop"])))
+            out.sort(key=lambda r: (r[0], r[2]))
+            yield out
+
+    def timestamps(self, underlying, start=None, end=None):
+        stamps = set()
+        for rows in self._selected(underlying, start, end, None):
+            stamps.update(r[0] for r in rows)
+        return pd.DatetimeIndex(sorted(stamps))
+
+    def read(self, underlying, start=None, end=None, expiry=None):
+        """
+        Yield one OptionChain per stored timestamp in [start, end].
+
+        Columns are memory-mapped; when a snapshot spans a single
+        (selected) expiry the chain's columns are views over the files.
+        Chains are writable; updates never reach the stored files.
+        Only one stored date is indexed at a time.
+        """
+        for rows in self._selected(underlying, start, end, expiry):
+            yield from self._chains(rows)
+
+    @staticmethod
+    def _chains(rows):
+        """
+        One OptionChain per timestamp of a date's sorted slices.
+        """
+        i = 0
+        while i < len(rows):
+            j = i
+            while j < len(rows) and rows[j][0] == rows[i][0]:
+                j += 1
+            group = rows[i:j]
+            i = j
+
+            ts, spot = group[0][0], group[0][1]
+            expiries = pd.DatetimeIndex([g[2] for g in group])
+            exp_dtype = pd.CategoricalDtype(expiries)
+
+            frames = []
+            for code, (_, _, _, part, a, b) in enumerate(group):
+                cols = part.columns()
+                data = {
+                    "type": pd.Categorical.from_codes(
+                        cols.pop("type")[a:b], dtype=TYPE_DTYPE
+                    ),
+                    "expiry": pd.Categorical.from_codes(
+                        np.full(b - a, code, dtype=np.int16), dtype=exp_dtype
+                    ),
+                }
+                data.update({name: v[a:b] for name, v in cols.items()})
+                frames.append(pd.DataFrame(data, copy=False))
+
+            df = frames[0] if len(frames) == 1 else \
+                pd.concat(frames, ignore_index=True)
+
+            yield OptionChain.from_dataframe(
+                df,
+                underlying=None if np.isnan(spot) else spot,
+                timestamp=pd.Timestamp(ts),
+                copy=False,
+            )
@@ -1 +1,3 @@
 from .option_chain import OptionChain
+from .exposure import DealerExposure
+from .parity import parity_forwards
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+from qfinindia.options.batch import chain_inputs
+from qfinindia.options.greeks import bs_greeks, _INV_SQRT_2PI
+
+
+EXPOSURE_COLUMNS = ["gex", "vanna", "charm"]
+
+
+class DealerExposure:
+    """
+    Open-interest weighted dealer exposures for a (multi-expiry) chain.
+
+    Dealers are assumed long calls and short puts (call_sign=+1,
+    put_sign=-1). Units, per contract row:
+
+        gex   : gamma * OI * lot * S^2 * 0.01   (delta change per 1% move)
+        vanna : vanna * OI * lot * S * 0.01     (delta change per vol point)
+        charm : charm * OI * lot * S / 365      (delta change per day)
+    """
+
+    def __init__(self, strikes, expiries, is_call, exposures,
+                 spot, rate, vol, time, weight):
+        self.strikes = strikes
+        self.expiries = expiries
+        self.is_call = is_call
+        self.exposures = exposures
+        self.spot = spot
+        self.rate = rate
+        self.vol = vol
+        self.time = time
+        self.weight = weight
+
+    @classmethod
+    def from_chain(cls, chain, rate, time=None, lot_size=1,
+                   call_sign=1.0, put_sign=-1.0):
+        if "oi" not in chain.data.columns:
+            raise ValueError("OI column missing")
+
+        S, K, sigma, T, is_call = chain_inputs(chain, time)
+        oi = chain.data["oi"].to_numpy(dtype=float)
+
+        g = bs_greeks(S, K, rate, sigma, T, is_call)
+
+        # signed OI notional; rows without iv/oi contribute nothing
+        weight = np.where(is_call, call_sign, put_sign) * oi * lot_size
+        weight = np.nan_to_num(weight)
+
+        exposures = np.vstack([
+            g.gamma * S**2 * 0.01,
+            g.vanna * S * 0.01,
+            g.charm * S / 365.0,
+        ]) * weight
+        exposures = np.nan_to_num(exposures)
+
+        return cls(
+            strikes=K,
+            expiries=chain.data["expiry"].to_numpy(),
+            is_call=is_call,
+            exposures=exposures,
+            spot=S,
+            rate=rate,
+            vol=sigma,
+            time=T,
+            weight=weight,
+        )
+
+    # ---------- grouped reductions ----------
+
+    def _group(self, keys, name):
+        labels, codes = np.unique(keys, return_inverse=True)
+        sums = np.vstack([
+            np.bincount(codes, weights=row, minlength=labels.size)
+            for row in self.exposures
+        ])
+        return pd.DataFrame(
+            sums.T, index=pd.Index(labels, name=name), columns=EXPOSURE_COLUMNS
+        )
+
+    def by_strike(self):
+        return self._group(self.strikes, "strike")
+
+    def by_expiry(self):
+        return self._group(self.expiries, "expiry")
+
+    def total(self):
+        return pd.Series(self.exposures.sum(axis=1), index=EXPOSURE_COLUMNS)
+
+    # ---------- gamma flip ----------
+
+    def gex_profile(self, spots, chunk=64):
+        """
+        Total gamma exposure re-evaluated at each spot level.
+        """
+        spots = np.asarray(spots, dtype=float)
+        K, sigma, T, w = np.broadcast_arrays(
+            self.strikes, self.vol, self.time, self.weight
+        )
+
+        # expired or zero-vol rows carry no gamma; they would make d1 NaN
+        live = np.isfinite(sigma) & (sigma > 0) & np.isfinite(T) & (T > 0) \
+            & (w != 0)
+        K, sigma, T, w = K[live], sigma[live], T[live], w[live]
+
+        # d1 is affine in log(S): d1 = log(S) * b + a
+        sig_sqrt_t = sigma * np.sqrt(T)
+        b = 1.0 / sig_sqrt_t
+        a = (-np.log(K) + (self.rate + 0.5 * sigma**2) * T) * b
+        c = w * b * _INV_SQRT_2PI
+
+        log_s = np.log(spots)
+        out = np.empty(spots.size)
+        for i in range(0, spots.size, chunk):
+            d1 = log_s[i:i + chunk, None] * b + a
+            out[i:i + chunk] = np.exp(-0.5 * d1**2) @ c
+
+        # gamma carries 1/S; GEX scales it by S^2 * 0.01
+        return out * spots * 0.01
+
+    def gamma_flip(self, width=0.1, n=201, spots=None):
+        """
+        Spot level where total GEX changes sign, nearest to current spot.
+        Searched on spots (default: spot * [1 - width, 1 + width]).
+        """
+        if spots is None:
+            spots = self.spot * np.linspace(1 - width, 1 + width, n)
+        spots = np.asarray(spots, dtype=float)
+
+        gex = self.gex_profile(spots)
+
+        idx = np.flatnonzero(np.sign(gex[:-1]) * np.sign(gex[1:]) < 0)
+        if idx.size == 0:
+            return np.nan
+
+        x0, x1 = spots[idx], spots[idx + 1]
+        y0, y1 = gex[idx], gex[idx + 1]
+        roots = x0 - y0 * (x1 - x0) / (y1 - y0)
+        return roots[np.argmin(np.abs(roots - self.spot))]
@@ -1,16 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from qfinindia.market.parity import parity_forwards
+
+
 class MarketIntelligence:
 
-    def __init__(self, chain, dist, tail):
+    def __init__(self, chain, dist, tail, forward=None):
+        """
+        forward is the put-call parity forward used by Analytics and
+        VolMetrics; None falls back to the distribution mean.
+        """
         self.chain = chain
         self.dist = dist
         self.tail = tail
+        self._forward = forward
+
+    @classmethod
+    def from_metrics(cls, chain, dist, tail, expiry=None):
+        """
+        expiry (default: first) selects the parity forward.
+        """
+        expiry = chain.expiries()[0] if expiry is None else pd.Timestamp(expiry)
+        fwd = np.nan
+        if "price" in chain.data.columns:
+            fwd = parity_forwards(chain, expiry)["forward"].get(expiry, np.nan)
+        return cls(chain, dist, tail, float(fwd) if np.isfinite(fwd) else None)
 
     @classmethod
-    def from_metrics(cls, chain, dist, tail):
-        return cls(chain, dist, tail)
+    def from_context(cls, context, expiry=None):
+        return cls(
+            context.chain,
+            context.distribution(expiry),
+            context.tail(expiry),
+            context.forward(expiry),
+        )
 
     def forward(self):
-        return self.dist.mean()
+        if self._forward is None:
+            return self.dist.mean()
+        return self._forward
 
     def expected_move(self):
         return self.dist.std()
@@ -1,10 +1,16 @@
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, field, InitVar
 from typing import Optional
 
 
 REQUIRED_COLUMNS = {"type", "strike", "expiry", "price"}
 OPTION_TYPES = {"C", "P"}
+SORT_KEYS = ["expiry", "type", "strike"]
+TYPE_DTYPE = pd.CategoricalDtype(["C", "P"])
+
+# snapshot fields a chain shares with its memoized slices
+SHARED_FIELDS = ("underlying", "timestamp")
 
 
 # ---------- Helpers ----------
@@ -33,26 +39,222 @@ def _normalize_option_types(series: pd.Series) -> pd.Series:
     return normalized
 
 
+def _types_normalized(series: pd.Series) -> bool:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.dtype == TYPE_DTYPE
+    return bool(series.isin(OPTION_TYPES).all())
+
+
+def _expiry_normalized(series: pd.Series) -> bool:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return (
+            pd.api.types.is_datetime64_dtype(dtype.categories.dtype)
+            and dtype.categories.is_monotonic_increasing
+        )
+    return pd.api.types.is_datetime64_dtype(dtype)
+
+
+def _expiry_keys(series: pd.Series) -> np.ndarray:
+    """
+    Orderable per-row expiry keys: category codes when compact.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy()
+    return series.to_numpy()
+
+
+def _put_mask(series: pd.Series) -> np.ndarray:
+    if series.dtype == TYPE_DTYPE:
+        return series.cat.codes.to_numpy() == 1
+    return series.to_numpy() == "P"
+
+
+def _cast_update(name, values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """
+    Cast update values to a column dtype, raising ValueError instead of
+    truncating, wrapping or overflowing (NaN or 1234.7 into an integer
+    column, 3e9 into int32, 1e39 into float32).
+    """
+    if np.can_cast(values.dtype, dtype, "safe"):
+        return values.astype(dtype, copy=False)
+
+    numeric = values.dtype.kind in "biuf"
+    if dtype.kind in "iu" and numeric:
+        info = np.iinfo(dtype)
+        # info.max + 1 is exact as a float, info.max may round up
+        ok = (values >= info.min) & (values < info.max + 1)
+        if values.dtype.kind == "f":
+            ok &= np.isfinite(values) & (np.round(values) == values)
+    elif dtype.kind == "f" and numeric:
+        with np.errstate(over="ignore"):
+            cast = values.astype(dtype)
+        ok = np.isfinite(cast) | ~np.isfinite(values)
+    elif np.can_cast(values.dtype, dtype, "same_kind"):
+        ok = np.ones(len(values), dtype=bool)
+    else:
+        raise ValueError(
+            f"Cannot store {values.dtype} updates in {name!r} ({dtype})"
+        )
+
+    if not ok.all():
+        raise ValueError(
+            f"Update values for {name!r} do not fit {dtype}: "
+            f"{values[~ok][:5].tolist()}"
+        )
+    return cast if dtype.kind == "f" and numeric else values.astype(dtype)
+
+
+def _is_sorted(df: pd.DataFrame) -> bool:
+    """
+    O(n) check that rows are ordered by (expiry, type, strike).
+    """
+    if len(df) < 2:
+        return True
+
+    e = _expiry_keys(df["expiry"])
+    t = _put_mask(df["type"])
+    k = df["strike"].to_numpy()
+
+    same_e = e[1:] == e[:-1]
+    same_t = t[1:] == t[:-1]
+    ok = (e[1:] > e[:-1]) | (same_e & (
+        (t[1:] > t[:-1]) | (same_t & (k[1:] >= k[:-1]))
+    ))
+    return bool(ok.all())
+
+
+class _ChainIndex:
+    """
+    Offset table over a chain sorted by (expiry, type, strike).
+
+    For expiry block i, calls occupy rows [starts[i], splits[i]) and
+    puts [splits[i], stops[i]); strikes within each run are ascending.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        n = len(df)
+        e = _expiry_keys(df["expiry"])
+        is_call = ~_put_mask(df["type"])
+
+        if n:
+            starts = np.flatnonzero(np.r_[True, e[1:] != e[:-1]])
+        else:
+            starts = np.zeros(0, dtype=np.intp)
+
+        self.expiries = df["expiry"].iloc[starts].to_numpy()
+        self.starts = starts
+        self.stops = np.r_[starts[1:], n].astype(np.intp)
+        self.splits = starts + (
+            np.add.reduceat(is_call.astype(np.intp), starts) if n else 0
+        )
+        self.strikes = df["strike"].to_numpy()
+
+    def locate(self, expiry) -> int:
+        """
+        Block position of an expiry, or -1. O(log E).
+        """
+        if len(self.expiries) == 0:
+            return -1
+        key = pd.Timestamp(expiry).to_datetime64().astype(self.expiries.dtype)
+        i = int(np.searchsorted(self.expiries, key))
+        if i < len(self.expiries) and self.expiries[i] == key:
+            return i
+        return -1
+
+    def runs(self, expiry=None, option_type=None):
+        """
+        (start, stop) row ranges selected by expiry and/or type.
+        """
+        if expiry is None:
+            blocks = range(len(self.starts))
+        else:
+            i = self.locate(expiry)
+            blocks = [] if i < 0 else [i]
+
+        runs = []
+        for i in blocks:
+            if option_type == "C":
+                runs.append((self.starts[i], self.splits[i]))
+            elif option_type == "P":
+                runs.append((self.splits[i], self.stops[i]))
+            else:
+                runs.append((self.starts[i], self.stops[i]))
+        return runs
+
+
 @dataclass
 class OptionChain:
+    """
+    Option chain kept sorted by (expiry, type, strike).
+
+    Slices by expiry/type are zero-copy row views located through an
+    offset index and memoized per chain. Setting underlying or
+    timestamp also sets it on the memoized slices.
+    """
     data: pd.DataFrame
     underlying: Optional[float] = None
     timestamp: Optional[pd.Timestamp] = None
+    _presorted: InitVar[bool] = False
+
+    _index: Optional[_ChainIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _slices: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # bumped by apply_updates; per-expiry copy records the last change
+    version: int = field(default=0, init=False, repr=False, compare=False)
+    _expiry_versions: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in SHARED_FIELDS:
+            for sub in self.__dict__.get("_slices", {}).values():
+                setattr(sub, name, value)
+
+    def __post_init__(self, _presorted):
+        if not _presorted and not _is_sorted(self.data):
+            self.data = self.data.sort_values(SORT_KEYS, kind="mergesort")
 
     # ---------- Constructors ----------
 
     @classmethod
-    def from_dataframe(cls, df: pd.DataFrame, underlying=None, timestamp=None):
-        df = df.copy()
+    def from_dataframe(cls, df: pd.DataFrame, underlying=None, timestamp=None,
+                       copy=True, compact=False):
+        """
+        Build a chain from a DataFrame.
+
+        Columns that are already normalized (C/P types, datetime expiry)
+        are not re-parsed; with copy=False a normalized, sorted frame is
+        used as-is. compact=True stores it in the compact layout
+        (see `compact`).
+        """
+        normalized = {}
 
         # normalize option types BEFORE validation
-        df["type"] = _normalize_option_types(df["type"])
+        if "type" in df.columns and not _types_normalized(df["type"]):
+            normalized["type"] = _normalize_option_types(df["type"])
 
         # normalize expiry to datetime
-        df["expiry"] = pd.to_datetime(df["expiry"])
+        if "expiry" in df.columns and not _expiry_normalized(df["expiry"]):
+            normalized["expiry"] = pd.to_datetime(df["expiry"])
+
+        if normalized:
+            df = df.assign(**normalized)
+        elif copy:
+            df = df.copy()
 
         cls._validate_schema(df)
-        return cls(df, underlying, timestamp)
+
+        if not _is_sorted(df):
+            df = df.sort_values(SORT_KEYS, kind="mergesort")
+
+        chain = cls(df, underlying, timestamp, _presorted=True)
+        return chain.compact() if compact else chain
 
     @classmethod
     def from_csv(cls, path: str, **kwargs):
@@ -68,7 +270,7 @@ class OptionChain:
     def from_nse(cls, json_data: dict):
         from qfinindia.data.nse import parse_nse_chain
         df, underlying, timestamp = parse_nse_chain(json_data)
-        return cls.from_dataframe(df, underlying, timestamp)
+        return cls.from_dataframe(df, underlying, timestamp, copy=False)
 
     # ---------- Validation ----------
 
@@ -88,30 +290,250 @@ class OptionChain:
         if not set(df["type"].unique()).issubset(OPTION_TYPES):
             raise ValueError("Option type must normalize to C or P")
 
+    # ---------- Index ----------
+
+    def _get_index(self) -> _ChainIndex:
+        if self._index is None:
+            self._index = _ChainIndex(self.data)
+        return self._index
+
+    def _view(self, runs):
+        merged = []
+        for a, b in runs:
+            if merged and merged[-1][1] == a:
+                merged[-1] = (merged[-1][0], b)
+            else:
+                merged.append((a, b))
+        runs = merged
+
+        if len(runs) == 1:
+            start, stop = runs[0]
+            df = self.data.iloc[start:stop]
+        else:
+            rows = np.concatenate(
+                [np.arange(a, b) for a, b in runs]
+            ) if runs else np.zeros(0, dtype=np.intp)
+            df = self.data.iloc[rows]
+        return OptionChain(df, self.underlying, self.timestamp, _presorted=True)
+
+    def _slice(self, expiry=None, option_type=None):
+        if expiry is not None:
+            expiry = pd.Timestamp(expiry)
+
+        key = (expiry, option_type)
+        sub = self._slices.get(key)
+        if sub is None:
+            sub = self._view(self._get_index().runs(expiry, option_type))
+            self._slices[key] = sub
+        return sub
+
+    def clear_cache(self):
+        """
+        Drop memoized slices (e.g. to release them); later calls/puts/
+        expiry rebuild views from the offset index.
+        """
+        self._slices = {}
+
+    def expiries(self):
+        return pd.DatetimeIndex(self._get_index().expiries)
+
     # ---------- Filters ----------
 
-    def calls(self):
-        return OptionChain(
-            self.data[self.data.type == "C"],
-            self.underlying,
-            self.timestamp
-        )
+    def calls(self, expiry=None):
+        return self._slice(expiry, "C")
 
-    def puts(self):
-        return OptionChain(
-            self.data[self.data.type == "P"],
-            self.underlying,
-            self.timestamp
-        )
+    def puts(self, expiry=None):
+        return self._slice(expiry, "P")
 
     def expiry(self, expiry):
-        expiry = pd.to_datetime(expiry)
-        return OptionChain(
-            self.data[self.data.expiry == expiry],
-            self.underlying,
-            self.timestamp
+        return self._slice(expiry)
+
+    def strike_window(self, center, n, expiry=None, option_type=None):
+        """
+        The n strikes either side of the strike nearest `center`
+        (e.g. ATM +/- n), per (expiry, type) run, by binary search.
+        """
+        index = self._get_index()
+        K = index.strikes
+        types = [option_type] if option_type is not None else ["C", "P"]
+
+        runs = []
+        blocks = sorted(r for t in types for r in index.runs(expiry, t))
+        for a, b in blocks:
+            if a == b:
+                continue
+            i = a + int(np.searchsorted(K[a:b], center))
+            if i == b or (i > a and center - K[i - 1] <= K[i] - center):
+                i -= 1
+            runs.append((max(a, i - n), min(b, i + n + 1)))
+        return self._view(runs)
+
+    # ---------- Updates ----------
+
+    def _locate_rows(self, expiry, is_put, strikes) -> np.ndarray:
+        """
+        Row positions of (expiry, type, strike) keys via the index.
+        """
+        index = self._get_index()
+        K = index.strikes
+        rows = np.full(len(strikes), -1, dtype=np.intp)
+
+        exp_keys, exp_codes = np.unique(expiry, return_inverse=True)
+        for code, e in enumerate(exp_keys):
+            for put in (False, True):
+                sel = np.flatnonzero((exp_codes == code) & (is_put == put))
+                if sel.size == 0:
+                    continue
+                runs = index.runs(e, "P" if put else "C")
+                if not runs:
+                    continue
+                a, b = runs[0]
+                pos = a + np.searchsorted(K[a:b], strikes[sel])
+                found = pos < b
+                found[found] = K[pos[found]] == strikes[sel][found]
+                rows[sel[found]] = pos[found]
+        return rows
+
+    def locate(self, keys):
+        """
+        Row positions of the contracts in `keys` (a DataFrame or dict
+        with expiry, type, strike columns); -1 where not in the chain.
+        """
+        keys = keys if isinstance(keys, pd.DataFrame) else pd.DataFrame(keys)
+
+        missing = set(SORT_KEYS) - set(keys.columns)
+        if missing:
+            raise ValueError(f"Missing update key columns: {missing}")
+
+        types = keys["type"]
+        if not _types_normalized(types):
+            types = _normalize_option_types(types)
+
+        return self._locate_rows(
+            pd.to_datetime(keys["expiry"]).to_numpy(),
+            _put_mask(types),
+            keys["strike"].to_numpy(),
         )
 
+    def apply_updates(self, updates):
+        """
+        Patch values for a subset of contracts in place.
+
+        Parameters
+        ----------
+        updates : pandas.DataFrame or dict
+            Key columns expiry, type, strike plus the columns to patch
+            (e.g. price, iv, oi). Values that the column dtype cannot
+            hold exactly (NaN or fractions into integers, overflow) raise
+            ValueError before anything is written.
+
+        Returns
+        -------
+        pandas.DatetimeIndex
+            Expiries whose rows changed. `version` is bumped once and
+            `expiry_version` reports it for each of these expiries.
+        """
+        upd = updates if isinstance(updates, pd.DataFrame) \
+            else pd.DataFrame(updates)
+
+        columns = [c for c in upd.columns if c not in SORT_KEYS]
+        unknown = set(columns) - set(self.data.columns)
+        if unknown:
+            raise ValueError(f"Unknown update columns: {unknown}")
+
+        rows = self.locate(upd)
+        expiry = pd.to_datetime(upd["expiry"]).to_numpy()
+        if (rows < 0).any():
+            bad = upd.loc[rows < 0, SORT_KEYS]
+            raise KeyError(f"Contracts not in chain: {bad.values.tolist()}")
+
+        patches = {}
+        for name in columns:
+            dtype = self.data[name].dtype
+            values = upd[name].to_numpy()
+            if isinstance(dtype, np.dtype):
+                values = _cast_update(name, values, dtype)
+            patches[name] = values
+
+        for name, values in patches.items():
+            self.data.iloc[rows, self.data.columns.get_loc(name)] = values
+
+        changed = pd.DatetimeIndex(np.unique(expiry))
+
+        self.version += 1
+        for e in changed:
+            self._expiry_versions[e] = self.version
+
+        # views of untouched expiries stay valid
+        self._slices = {
+            key: sub for key, sub in self._slices.items()
+            if key[0] is not None and key[0] not in changed
+        }
+
+        return changed
+
+    def expiry_version(self, expiry) -> int:
+        """
+        Chain version at which this expiry last changed (0 = never).
+        """
+        return self._expiry_versions.get(pd.Timestamp(expiry), 0)
+
+    # ---------- Storage ----------
+
+    def compact(self, float_dtype=None, int_strikes=True):
+        """
+        Return the chain in a compact columnar layout.
+
+        - type: categorical C/P (int8 codes)
+        - expiry: categorical code table over the sorted expiries
+        - strike: int32 points when every strike is integral
+        - integer columns: int32 when values fit
+        - other float columns: float_dtype, e.g. "float32" (default keeps
+          float64; RND second derivatives are sensitive to price rounding)
+        """
+        df = self.data
+        cols = {
+            "type": df["type"].astype(TYPE_DTYPE),
+            "expiry": df["expiry"].astype(
+                pd.CategoricalDtype(self.expiries())
+            ),
+        }
+
+        strikes = df["strike"].to_numpy()
+        i32 = np.iinfo(np.int32)
+        if (
+            int_strikes
+            and np.all(np.isfinite(strikes))
+            and np.all(np.mod(strikes, 1) == 0)
+            and (len(strikes) == 0
+                 or (strikes.min() >= i32.min and strikes.max() <= i32.max))
+        ):
+            cols["strike"] = df["strike"].astype(np.int32)
+
+        for name in df.columns:
+            if name in cols:
+                continue
+            col = df[name]
+            if float_dtype is not None and pd.api.types.is_float_dtype(col.dtype):
+                cols[name] = col.astype(float_dtype)
+            elif pd.api.types.is_integer_dtype(col.dtype) and len(col) and \
+                    col.min() >= i32.min and col.max() <= i32.max:
+                cols[name] = col.astype(np.int32)
+
+        # views are positional, so the row labels can be a RangeIndex
+        df = df.assign(**cols).reset_index(drop=True)
+        return OptionChain(df, self.underlying, self.timestamp, _presorted=True)
+
+    def memory_usage(self):
+        """
+        Bytes held per column (deep), with dtypes and a total row.
+        """
+        usage = self.data.memory_usage(index=True, deep=True)
+        dtypes = self.data.dtypes.astype(str).reindex(usage.index)
+        report = pd.DataFrame({"dtype": dtypes, "bytes": usage})
+        report.loc["total"] = ["", int(usage.sum())]
+        return report
+
     # ---------- Accessors ----------
 
     def strikes(self):
@@ -125,5 +547,23 @@ class OptionChain:
             raise ValueError("IV column missing")
         return self.data["iv"].values
 
+    # ---------- Derived columns ----------
+
+    def add_iv(self, rate, time=None, price_column="price", **kwargs):
+        """
+        Return a chain with `iv` solved from prices for every row.
+
+        time defaults to ACT/365 from `timestamp` to each expiry.
+        Rows that do not converge get NaN and `iv_converged=False`.
+        """
+        from qfinindia.options.batch import implied_vol_chain
+
+        iv, converged = implied_vol_chain(
+            self, rate, time=time, price_column=price_column, **kwargs
+        )
+
+        df = self.data.assign(iv=iv, iv_converged=converged)
+        return OptionChain(df, self.underlying, self.timestamp)
+
     def to_dataframe(self):
         return self.data.copy()
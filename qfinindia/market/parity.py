@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+
+PARITY_COLUMNS = ["forward", "discount", "pairs"]
+
+
+def parity_forwards(chain, expiries=None, n=8, price_column="price"):
+    """
+    Forward and discount factor per expiry from put-call parity.
+
+    Calls and puts are paired at matching strikes; for each expiry the
+    n pairs nearest the strike where |C - P| is smallest are used to
+    regress C - P = D F - D K on K, so D = -slope and
+    F = -intercept / slope. All expiries are solved at once from
+    grouped sums. Expiries with fewer than two pairs give NaN.
+
+    Returns
+    -------
+    pandas.DataFrame indexed by expiry with columns forward, discount,
+    pairs.
+    """
+    if price_column not in chain.data.columns:
+        raise ValueError(f"{price_column!r} column missing")
+
+    if expiries is None:
+        df = chain.data
+    else:
+        expiries = pd.to_datetime(np.atleast_1d(expiries))
+        df = pd.concat([chain.expiry(e).data for e in expiries])
+
+    key = ["expiry", "strike"]
+    calls = df.loc[(df["type"] == "C").to_numpy(), key + [price_column]]
+    puts = df.loc[(df["type"] == "P").to_numpy(), key + [price_column]]
+    pairs = calls.merge(puts, on=key, suffixes=("_c", "_p"))
+
+    expiry = pd.to_datetime(np.asarray(pairs["expiry"]))
+    K = pairs["strike"].to_numpy(dtype=float)
+    y = pairs[f"{price_column}_c"].to_numpy(dtype=float) - \
+        pairs[f"{price_column}_p"].to_numpy(dtype=float)
+
+    ok = np.isfinite(y)
+    expiry, K, y = expiry[ok], K[ok], y[ok]
+
+    labels = expiry.unique().sort_values() if expiries is None \
+        else pd.DatetimeIndex(expiries)
+    out = pd.DataFrame(np.nan, index=labels, columns=PARITY_COLUMNS)
+    out.index.name = "expiry"
+    out["pairs"] = 0
+    if len(K) == 0:
+        return out
+
+    g = labels.get_indexer(expiry)
+    groups = len(labels)
+
+    # centre each expiry on its min |C - P| strike, keep the n nearest
+    centre = pd.Series(np.abs(y)).groupby(g).idxmin().reindex(range(groups))
+    centre_k = np.full(groups, np.nan)
+    has = centre.notna().to_numpy()
+    centre_k[has] = K[centre.to_numpy()[has].astype(np.intp)]
+
+    dist = np.abs(K - centre_k[g])
+    order = np.lexsort((dist, g))
+    rank = np.empty(len(K), dtype=np.intp)
+    starts = np.searchsorted(g[order], np.arange(groups))
+    rank[order] = np.arange(len(K)) - starts[g[order]]
+    use = rank < n
+
+    g, K, y = g[use], K[use], y[use]
+
+    # grouped least squares of y on K
+    cnt = np.bincount(g, minlength=groups).astype(float)
+    sx = np.bincount(g, K, minlength=groups)
+    sy = np.bincount(g, y, minlength=groups)
+    sxx = np.bincount(g, K * K, minlength=groups)
+    sxy = np.bincount(g, K * y, minlength=groups)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (cnt * sxy - sx * sy) / (cnt * sxx - sx * sx)
+        intercept = (sy - slope * sx) / cnt
+        valid = (cnt >= 2) & (slope < 0)
+        out["forward"] = np.where(valid, -intercept / slope, np.nan)
+        out["discount"] = np.where(valid, -slope, np.nan)
+    out["pairs"] = cnt.astype(int)
+    return out
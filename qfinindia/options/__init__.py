@@ -0,0 +1,3 @@
+from .black_scholes import NSEOption, FastNSEOption
+from .batch import bs_price, bs_call_put, price_chain, implied_vol
+from .greeks import Greeks, bs_greeks, greeks_chain
@@ -0,0 +1,287 @@
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+
+DAYS_PER_YEAR = 365.0
+
+# NSE index options expire at market close (IST); exchange timestamps
+# are naive IST, so the cutoff is added to date-only expiries
+EXPIRY_CUTOFF = pd.Timedelta(hours=15, minutes=30)
+
+
+# ---------- helpers ----------
+
+def call_mask(option_type):
+    """
+    Boolean array that is True for calls.
+    Accepts booleans (True = call) or labels like C/P, call/put, CE/PE.
+    """
+    arr = np.asarray(option_type)
+
+    if arr.dtype == bool:
+        return arr
+
+    is_call = arr == "C"
+    if np.all(is_call | (arr == "P")):
+        return is_call
+
+    from qfinindia.market.option_chain import _normalize_option_types
+
+    labels = _normalize_option_types(pd.Series(arr.ravel()))
+    if labels.isna().any():
+        bad = arr.ravel()[labels.isna().values]
+        raise ValueError(
+            f"Invalid option type values found: {np.unique(bad.astype(str))} "
+            f"(allowed: call/put/CE/PE/c/p)"
+        )
+    return (labels.values == "C").reshape(arr.shape)
+
+
+def year_fraction(expiry, timestamp, cutoff=EXPIRY_CUTOFF):
+    """
+    ACT/365 time from timestamp to expiry, in years.
+
+    Date-only expiries (midnight) are moved to `cutoff` on that day
+    (15:30 by default, None to disable); rows past expiry get T <= 0.
+    """
+    if timestamp is None:
+        raise ValueError("timestamp is required to derive time to expiry")
+
+    expiry = pd.to_datetime(np.asarray(expiry).ravel())
+    if cutoff is not None:
+        expiry = expiry.where(expiry != expiry.normalize(), expiry + cutoff)
+    delta = (expiry - pd.Timestamp(timestamp)) / pd.Timedelta(days=1)
+    return np.asarray(delta, dtype=float) / DAYS_PER_YEAR
+
+
+def chain_inputs(chain, time=None, vol=None, cutoff=EXPIRY_CUTOFF):
+    """
+    Column arrays (spot, strike, vol, time, is_call) for a whole chain.
+    """
+    df = chain.data
+
+    if chain.underlying is None:
+        raise ValueError("chain.underlying is required for pricing")
+
+    if vol is None:
+        if "iv" not in df.columns:
+            raise ValueError("IV column missing")
+        vol = df["iv"].to_numpy(dtype=float)
+
+    if time is None:
+        time = year_fraction(df["expiry"], chain.timestamp, cutoff)
+
+    return (
+        float(chain.underlying),
+        df["strike"].to_numpy(dtype=float),
+        np.asarray(vol, dtype=float),
+        np.asarray(time, dtype=float),
+        call_mask(df["type"].to_numpy()),
+    )
+
+
+# ---------- core terms ----------
+
+def bs_d1_d2(spot, strike, rate, vol, time):
+    """
+    Broadcast d1/d2 with the same operation order as NSEOption.
+    Undefined (NaN/inf) for T <= 0; callers mask those rows.
+    """
+    S = np.asarray(spot, dtype=float)
+    K = np.asarray(strike, dtype=float)
+    r = np.asarray(rate, dtype=float)
+    sigma = np.asarray(vol, dtype=float)
+    T = np.asarray(time, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+    return d1, d2
+
+
+# ---------- pricing ----------
+
+def bs_call_put(spot, strike, rate, vol, time):
+    """
+    Call and put prices for every contract in one broadcast pass.
+    Rows with T <= 0 are priced at intrinsic value.
+
+    Returns
+    -------
+    (call, put) : tuple of numpy.ndarray
+    """
+    d1, d2 = bs_d1_d2(spot, strike, rate, vol, time)
+
+    S = np.asarray(spot, dtype=float)
+    disc_k = np.asarray(strike, dtype=float) * np.exp(
+        -np.asarray(rate, dtype=float) * np.asarray(time, dtype=float)
+    )
+
+    call = S * ndtr(d1) - disc_k * ndtr(d2)
+    put = disc_k * ndtr(-d2) - S * ndtr(-d1)
+
+    K = np.asarray(strike, dtype=float)
+    expired = np.asarray(time, dtype=float) <= 0
+    call = np.where(expired, np.maximum(S - K, 0.0), call)
+    put = np.where(expired, np.maximum(K - S, 0.0), put)
+    return call, put
+
+
+def bs_price(spot, strike, rate, vol, time, option_type="C"):
+    """
+    Vectorized Black-Scholes price; agrees with NSEOption.call_price /
+    NSEOption.put_price to machine precision for T > 0 (vectorized
+    log/exp may round differently by an ulp). Rows with
+    T <= 0 (at or past expiry) are priced at intrinsic value.
+
+    Parameters
+    ----------
+    spot, strike, rate, vol, time : float or array_like
+        Broadcast against each other.
+    option_type : str, bool or array_like
+        C/P labels (any form OptionChain accepts) or True for calls.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    d1, d2 = bs_d1_d2(spot, strike, rate, vol, time)
+
+    # put = -(call formula evaluated at -d1, -d2); negation is exact
+    w = np.where(call_mask(option_type), 1.0, -1.0)
+
+    S = np.asarray(spot, dtype=float)
+    disc_k = np.asarray(strike, dtype=float) * np.exp(
+        -np.asarray(rate, dtype=float) * np.asarray(time, dtype=float)
+    )
+
+    price = w * (S * ndtr(w * d1) - disc_k * ndtr(w * d2))
+
+    expired = np.asarray(time, dtype=float) <= 0
+    intrinsic = np.maximum(w * (S - np.asarray(strike, dtype=float)), 0.0)
+    return np.where(expired, intrinsic, price)
+
+
+def price_chain(chain, rate, time=None, vol=None):
+    """
+    Model price for every row of an OptionChain.
+
+    vol defaults to the chain's iv column and time to ACT/365 from
+    chain.timestamp to each row's expiry.
+    """
+    S, K, sigma, T, is_call = chain_inputs(chain, time, vol)
+    return bs_price(S, K, rate, sigma, T, is_call)
+
+
+# ---------- implied volatility ----------
+
+def _iv_initial_guess(price, S, disc_k, T, is_call):
+    """
+    Corrado-Miller rational approximation, on the call-equivalent price.
+    """
+    call = np.where(is_call, price, price + S - disc_k)
+    fwd_gap = S - disc_k
+    c = call - 0.5 * fwd_gap
+    root = np.sqrt(np.maximum(c**2 - fwd_gap**2 / np.pi, 0.0))
+    guess = np.sqrt(2.0 * np.pi / T) / (S + disc_k) * (c + root)
+    return np.where(np.isfinite(guess) & (guess > 0), guess, 0.2)
+
+
+def implied_vol(price, spot, strike, rate, time, option_type="C",
+                tol=1e-8, max_iter=100, vol_bounds=(1e-6, 5.0)):
+    """
+    Solve Black-Scholes implied volatility for every contract at once.
+
+    Safeguarded Newton: each row keeps a [lo, hi] bracket and falls back
+    to bisection whenever the Newton step leaves it. Converged rows are
+    dropped from the working set as the iteration proceeds.
+
+    Parameters
+    ----------
+    price, spot, strike, rate, time : float or array_like
+    option_type : str, bool or array_like
+    tol : float
+        Absolute price tolerance.
+    max_iter : int
+    vol_bounds : (float, float)
+        Initial bracket for sigma.
+
+    Returns
+    -------
+    (iv, converged) : tuple of numpy.ndarray
+        iv is NaN where the price lies outside no-arbitrage bounds,
+        T <= 0 (no time value to invert), or the solver did not
+        converge.
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(price, dtype=float),
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(time, dtype=float),
+        call_mask(option_type),
+    )
+    shape = arrays[0].shape
+    P, S, K, r, T, is_call = (a.ravel() for a in arrays)
+
+    disc_k = K * np.exp(-r * T)
+    lower = np.where(is_call, np.maximum(S - disc_k, 0.0),
+                     np.maximum(disc_k - S, 0.0))
+    upper = np.where(is_call, S, disc_k)
+
+    iv = np.full(P.shape, np.nan)
+    converged = np.zeros(P.shape, dtype=bool)
+
+    active = np.flatnonzero((P > lower) & (P < upper) & (T > 0))
+
+    lo = np.full(active.size, float(vol_bounds[0]))
+    hi = np.full(active.size, float(vol_bounds[1]))
+    sigma = np.clip(
+        _iv_initial_guess(P[active], S[active], disc_k[active],
+                          T[active], is_call[active]),
+        lo, hi,
+    )
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+
+        s, k, rr, t = S[active], K[active], r[active], T[active]
+        model = bs_price(s, k, rr, sigma, t, is_call[active])
+        diff = model - P[active]
+
+        d1, _ = bs_d1_d2(s, k, rr, sigma, t)
+        vega = s * np.exp(-0.5 * d1**2) / np.sqrt(2.0 * np.pi) * np.sqrt(t)
+
+        done = np.abs(diff) < tol
+        iv[active[done]] = sigma[done]
+        converged[active[done]] = True
+
+        # price is increasing in sigma, so the sign of diff moves the bracket
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff < 0, sigma, lo)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = sigma - diff / vega
+        bisect = ~np.isfinite(step) | (step <= lo) | (step >= hi)
+        sigma = np.where(bisect, 0.5 * (lo + hi), step)
+
+        keep = ~done
+        active, sigma, lo, hi = active[keep], sigma[keep], lo[keep], hi[keep]
+
+    return iv.reshape(shape), converged.reshape(shape)
+
+
+def implied_vol_chain(chain, rate, time=None, price_column="price", **kwargs):
+    """
+    Implied volatility for every row of an OptionChain.
+
+    Returns
+    -------
+    (iv, converged) : tuple of numpy.ndarray
+    """
+    S, K, _, T, is_call = chain_inputs(chain, time, vol=np.nan)
+    P = chain.data[price_column].to_numpy(dtype=float)
+    return implied_vol(P, S, K, rate, T, is_call, **kwargs)
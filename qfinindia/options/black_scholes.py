@@ -1,13 +1,35 @@
+import functools
+import math
+
 import numpy as np
 from scipy.stats import norm
 
 
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _norm_cdf(x):
+    return 0.5 * math.erfc(-x / _SQRT2)
+
+
+def _norm_pdf(x):
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
 class NSEOption:
     """
     Black-Scholes option pricing adapted for Indian markets.
     Provides price and Greeks.
     """
 
+    # math kernels; FastNSEOption swaps these for the stdlib versions
+    _cdf = staticmethod(norm.cdf)
+    _pdf = staticmethod(norm.pdf)
+    _log = staticmethod(np.log)
+    _sqrt = staticmethod(np.sqrt)
+    _exp = staticmethod(np.exp)
+
     def __init__(self, spot, strike, rate, vol, time):
         self.S = float(spot)
         self.K = float(strike)
@@ -17,52 +39,52 @@ class NSEOption:
 
     # ---------- core terms ----------
     def _d1(self):
-        return (np.log(self.S / self.K) +
+        return (self._log(self.S / self.K) +
                 (self.r + 0.5 * self.sigma**2) * self.T) / \
-               (self.sigma * np.sqrt(self.T))
+               (self.sigma * self._sqrt(self.T))
 
     def _d2(self):
-        return self._d1() - self.sigma * np.sqrt(self.T)
+        return self._d1() - self.sigma * self._sqrt(self.T)
 
     # ---------- pricing ----------
     def call_price(self):
         d1 = self._d1()
         d2 = self._d2()
-        return self.S * norm.cdf(d1) - \
-               self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+        return self.S * self._cdf(d1) - \
+               self.K * self._exp(-self.r * self.T) * self._cdf(d2)
 
     def put_price(self):
         d1 = self._d1()
         d2 = self._d2()
-        return self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - \
-               self.S * norm.cdf(-d1)
+        return self.K * self._exp(-self.r * self.T) * self._cdf(-d2) - \
+               self.S * self._cdf(-d1)
 
     # ---------- greeks ----------
     def call_delta(self):
-        return norm.cdf(self._d1())
+        return self._cdf(self._d1())
 
     def put_delta(self):
-        return norm.cdf(self._d1()) - 1
+        return self._cdf(self._d1()) - 1
 
     def gamma(self):
-        return norm.pdf(self._d1()) / \
-               (self.S * self.sigma * np.sqrt(self.T))
+        return self._pdf(self._d1()) / \
+               (self.S * self.sigma * self._sqrt(self.T))
 
     def vega(self):
-        return self.S * norm.pdf(self._d1()) * np.sqrt(self.T)
+        return self.S * self._pdf(self._d1()) * self._sqrt(self.T)
 
     def call_theta(self):
         d1 = self._d1()
         d2 = self._d2()
-        term1 = -self.S * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.T))
-        term2 = -self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+        term1 = -self.S * self._pdf(d1) * self.sigma / (2 * self._sqrt(self.T))
+        term2 = -self.r * self.K * self._exp(-self.r * self.T) * self._cdf(d2)
         return term1 + term2
 
     def put_theta(self):
         d1 = self._d1()
         d2 = self._d2()
-        term1 = -self.S * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.T))
-        term2 = self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2)
+        term1 = -self.S * self._pdf(d1) * self.sigma / (2 * self._sqrt(self.T))
+        term2 = self.r * self.K * self._exp(-self.r * self.T) * self._cdf(-d2)
         return term1 + term2
     
         # ---------- implied volatility ----------
@@ -96,3 +118,65 @@ class NSEOption:
 
         return sigma
 
+
+def _reference_if_degenerate(method):
+    """
+    Route T <= 0 or sigma == 0 to NSEOption, whose NumPy kernels give
+    the limiting price or NaN where the math kernels would raise.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        if self.T > 0 and self.sigma != 0:
+            return method(self)
+        ref = NSEOption(self.S, self.K, self.r, self.sigma, self.T)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(getattr(ref, name)())
+
+    return wrapper
+
+
+class FastNSEOption(NSEOption):
+    """
+    Low-latency scalar NSEOption.
+
+    Same interface and formulas, evaluated with math.erfc/math.exp on
+    Python floats so no NumPy scalars or SciPy dispatch are involved.
+    Agrees with NSEOption to within 1e-12 (see benchmarks/scalar_latency.py);
+    T <= 0 and sigma == 0 are delegated to NSEOption itself.
+    """
+
+    _cdf = staticmethod(_norm_cdf)
+    _pdf = staticmethod(_norm_pdf)
+    _log = staticmethod(math.log)
+    _sqrt = staticmethod(math.sqrt)
+    _exp = staticmethod(math.exp)
+
+    # pricing computes d1 once instead of via _d1/_d2
+    @_reference_if_degenerate
+    def call_price(self):
+        sqrt_t = math.sqrt(self.T)
+        d1 = (math.log(self.S / self.K) +
+              (self.r + 0.5 * self.sigma * self.sigma) * self.T) / \
+             (self.sigma * sqrt_t)
+        d2 = d1 - self.sigma * sqrt_t
+        return self.S * _norm_cdf(d1) - \
+               self.K * math.exp(-self.r * self.T) * _norm_cdf(d2)
+
+    @_reference_if_degenerate
+    def put_price(self):
+        sqrt_t = math.sqrt(self.T)
+        d1 = (math.log(self.S / self.K) +
+              (self.r + 0.5 * self.sigma * self.sigma) * self.T) / \
+             (self.sigma * sqrt_t)
+        d2 = d1 - self.sigma * sqrt_t
+        return self.K * math.exp(-self.r * self.T) * _norm_cdf(-d2) - \
+               self.S * _norm_cdf(-d1)
+
+    call_delta = _reference_if_degenerate(NSEOption.call_delta)
+    put_delta = _reference_if_degenerate(NSEOption.put_delta)
+    gamma = _reference_if_degenerate(NSEOption.gamma)
+    vega = _reference_if_degenerate(NSEOption.vega)
+    call_theta = _reference_if_degenerate(NSEOption.call_theta)
+    put_theta = _reference_if_degenerate(NSEOption.put_theta)
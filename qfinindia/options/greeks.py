@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, fields
+from scipy.special import ndtr
+
+from qfinindia.options.batch import bs_d1_d2, call_mask, chain_inputs
+
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+@dataclass
+class Greeks:
+    """
+    Structure-of-arrays Greek block, one entry per contract.
+    Units follow NSEOption: theta and charm per year, vega and volga
+    per 1.00 of vol, rho per 1.00 of rate.
+    """
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+    rho: np.ndarray
+    vanna: np.ndarray
+    volga: np.ndarray
+    charm: np.ndarray
+
+    def __len__(self):
+        return self.delta.size
+
+    def to_records(self):
+        names = [f.name for f in fields(self)]
+        return np.rec.fromarrays(
+            [np.ravel(getattr(self, n)) for n in names], names=names
+        )
+
+    def to_dataframe(self, index=None):
+        return pd.DataFrame(
+            {f.name: np.ravel(getattr(self, f.name)) for f in fields(self)},
+            index=index,
+        )
+
+
+def bs_greeks(spot, strike, rate, vol, time, option_type="C"):
+    """
+    All Greeks for arrays of contracts, sharing d1/d2, the normal
+    pdf/cdf and the discount factor across every sensitivity.
+    Rows with T <= 0 (at or past expiry) are NaN.
+
+    Returns
+    -------
+    Greeks
+    """
+    d1, d2 = bs_d1_d2(spot, strike, rate, vol, time)
+
+    S = np.asarray(spot, dtype=float)
+    K = np.asarray(strike, dtype=float)
+    r = np.asarray(rate, dtype=float)
+    sigma = np.asarray(vol, dtype=float)
+    T = np.asarray(time, dtype=float)
+
+    is_call = call_mask(option_type)
+    w = np.where(is_call, 1.0, -1.0)
+
+    sqrt_t = np.sqrt(np.maximum(T, 0.0))  # T <= 0 rows masked below
+    sig_sqrt_t = sigma * sqrt_t
+    pdf = np.exp(-0.5 * d1**2) * _INV_SQRT_2PI
+    cdf_d1 = ndtr(d1)
+    cdf_wd2 = ndtr(w * d2)
+    disc_k = K * np.exp(-r * T)
+
+    vega = S * pdf * sqrt_t
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        greeks = dict(
+            delta=np.where(is_call, cdf_d1, cdf_d1 - 1),
+            gamma=pdf / (S * sig_sqrt_t),
+            vega=vega,
+            theta=-S * pdf * sigma / (2 * sqrt_t) - w * r * disc_k * cdf_wd2,
+            rho=w * disc_k * T * cdf_wd2,
+            vanna=-pdf * d2 / sigma,
+            volga=vega * d1 * d2 / sigma,
+            charm=-pdf * (2 * r * T - d2 * sig_sqrt_t) / (2 * T * sig_sqrt_t),
+        )
+
+    expired = T <= 0
+    return Greeks(**{
+        name: np.where(expired, np.nan, value)
+        for name, value in greeks.items()
+    })
+
+
+def greeks_chain(chain, rate, time=None, vol=None):
+    """
+    Greek block for every row of an OptionChain.
+    """
+    S, K, sigma, T, is_call = chain_inputs(chain, time, vol)
+    return bs_greeks(S, K, rate, sigma, T, is_call)
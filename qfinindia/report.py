@@ -1,13 +1,25 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 from qfinindia.analytics import Analytics
+from qfinindia.context import AnalyticsContext
+import numpy as np
 import pandas as pd
 
 
-def _compute_metrics(chain, expiry=None):
+METRIC_COLUMNS = [
+    "spot", "forward", "forward_pct", "expected_move",
+    "atm_vol", "skew", "var_5", "var_1", "bias",
+]
+
+
+def _compute_metrics(chain, expiry=None, context=None):
     """
     Internal: compute all implied parameters once.
     Supports auto-expiry if not provided.
     """
-    a = Analytics(chain, expiry)
+    a = Analytics(chain, expiry, context=context)
 
     spot = a.spot
     fwd = a.forward
@@ -67,3 +79,88 @@ VaR 1%: {m['var_1']:.0f}
 Bias: {m['bias']}
 """
     return report.strip()
+
+
+def _cvar_column(alpha):
+    return f"cvar_{alpha * 100:g}"
+
+
+def _snapshot_rows(chain, cvar=(), **rnd_options):
+    """
+    Internal: metrics for every expiry of one snapshot, sharing one
+    AnalyticsContext. Failures become rows with an error message.
+    Each alpha in cvar adds a cvar_<pct> metric (0.05 -> cvar_5).
+    """
+    ts = chain.timestamp
+    try:
+        context = AnalyticsContext(chain, **rnd_options)
+        expiries = chain.expiries()
+    except Exception as exc:  # reported per row, never raised
+        return [(ts, pd.NaT, None, f"{type(exc).__name__}: {exc}")]
+
+    rows = []
+    for expiry in expiries:
+        try:
+            m = _compute_metrics(chain, expiry, context=context)
+            if cvar:
+                a = Analytics(chain, expiry, context=context)
+                for alpha in cvar:
+                    m[_cvar_column(alpha)] = float(a.cvar(alpha))
+            rows.append((ts, expiry, m, None))
+        except Exception as exc:
+            rows.append((ts, expiry, None, f"{type(exc).__name__}: {exc}"))
+    return rows
+
+
+def generate_reports(chains, processes=None, chunksize=16):
+    """
+    Implied market metrics for many snapshots, every expiry each.
+
+    Parameters
+    ----------
+    chains : iterable of OptionChain
+        E.g. a list of chains or SnapshotStore.read(...). Consumed
+        lazily, a bounded batch at a time.
+    processes : int, optional
+        Worker processes; None uses all cores, 0 runs in-process.
+    chunksize : int
+        Snapshots sent to a worker per task.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Indexed by (timestamp, expiry) with the generate_report metrics
+        and an `error` column (missing on success; metrics are NaN on
+        failure).
+    """
+    columns = {name: [] for name in ["timestamp", "expiry"] +
+               METRIC_COLUMNS + ["error"]}
+
+    def collect(rows):
+        for ts, expiry, m, error in rows:
+            columns["timestamp"].append(ts)
+            columns["expiry"].append(expiry)
+            for name in METRIC_COLUMNS:
+                columns[name].append(np.nan if m is None else m[name])
+            columns["error"].append(error)
+
+    chains = iter(chains)
+    if processes == 0:
+        for chain in chains:
+            collect(_snapshot_rows(chain))
+    else:
+        workers = processes or os.cpu_count() or 1
+        batch_size = chunksize * workers * 4
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                batch = list(islice(chains, batch_size))
+                if not batch:
+                    break
+                for rows in pool.map(_snapshot_rows, batch,
+                                     chunksize=chunksize):
+                    collect(rows)
+
+    df = pd.DataFrame(columns)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df["expiry"] = pd.to_datetime(df["expiry"])
+    return df.set_index(["timestamp", "expiry"])
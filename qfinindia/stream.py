@@ -0,0 +1,245 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from qfinindia.context import AnalyticsContext
+from qfinindia.market.option_chain import SORT_KEYS
+from qfinindia.report import _compute_metrics
+
+
+@dataclass
+class MetricUpdate:
+    """
+    Metrics for one (symbol, expiry) after a flush.
+
+    `delta` holds new - old for numeric metrics that moved (the new
+    value for non-numeric ones such as bias); on the first emission it
+    is the full metric set.
+    """
+    symbol: str
+    expiry: pd.Timestamp
+    timestamp: pd.Timestamp
+    metrics: dict
+    delta: dict
+
+
+def _delta(old, new):
+    if old is None:
+        return dict(new)
+
+    out = {}
+    for name, value in new.items():
+        prev = old.get(name)
+        if value == prev or (value != value and prev != prev):
+            continue
+        if isinstance(value, float) and isinstance(prev, float) \
+                and np.isfinite(value) and np.isfinite(prev):
+            out[name] = value - prev
+        else:
+            out[name] = value
+    return out
+
+
+class _Feed:
+    """
+    State of one streamed underlying.
+    """
+
+    def __init__(self, chain, context):
+        self.chain = chain
+        self.context = context
+        self.pending = []
+        self.spot = None
+        self.timestamp = None
+        self.handle = None
+        self.metrics = {}
+        self.ticks = 0
+        self.flushes = 0
+        self.rejected = 0
+
+
+class StreamingEngine:
+    """
+    Incremental report metrics over live chains.
+
+    Ticks are buffered per symbol; the first tick opens a debounce
+    window and everything that arrives inside it is applied with one
+    OptionChain.apply_updates at the end. Only the expiries it reports
+    dirty are recomputed through the symbol's AnalyticsContext (a spot
+    move refreshes all expiries from cached nodes), and MetricUpdate
+    deltas go to every subscriber.
+
+    Ticks on contracts the chain does not list are dropped and recorded
+    in `errors` under (symbol, "updates"); the rest of the window still
+    applies. Without a running event loop, call flush() explicitly.
+    """
+
+    def __init__(self, debounce=0.05, **rnd_options):
+        self.debounce = debounce
+        self.rnd_options = rnd_options
+        self.callbacks = []
+        self.errors = {}
+        self.last_flush_seconds = 0.0
+        self._feeds = {}
+
+    # ---------- setup ----------
+
+    def add_chain(self, symbol, chain, emit=True):
+        """
+        Start streaming symbol from chain (updated in place).
+        """
+        feed = _Feed(chain, AnalyticsContext(chain, **self.rnd_options))
+        self._feeds[symbol] = feed
+        self._recompute(symbol, feed, chain.expiries(), emit)
+        return self
+
+    def subscribe(self, callback):
+        """
+        callback(MetricUpdate) is called for every changed expiry.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def metrics(self, symbol):
+        """
+        Latest metrics per expiry as a DataFrame.
+        """
+        return pd.DataFrame.from_dict(
+            self._feeds[symbol].metrics, orient="index"
+        ).sort_index()
+
+    def stats(self):
+        return {
+            s: {"ticks": f.ticks, "flushes": f.flushes,
+                "rejected": f.rejected, "pending": len(f.pending)}
+            for s, f in self._feeds.items()
+        }
+
+    # ---------- ingest ----------
+
+    def submit(self, symbol, updates=None, spot=None, timestamp=None):
+        """
+        Queue a tick: contract updates (as for apply_updates) and/or a
+        new spot. Returns immediately; work happens on flush.
+        """
+        feed = self._feeds[symbol]
+        if updates is not None:
+            if not isinstance(updates, pd.DataFrame):
+                updates = pd.DataFrame(updates)
+            feed.pending.append(updates)
+        if spot is not None:
+            feed.spot = spot
+        if timestamp is not None:
+            feed.timestamp = timestamp
+        feed.ticks += 1
+
+        if feed.handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            feed.handle = loop.call_later(self.debounce, self.flush, symbol)
+
+    def flush(self, symbol=None):
+        """
+        Apply buffered ticks and emit deltas now (one or all symbols).
+        """
+        symbols = list(self._feeds) if symbol is None else [symbol]
+        for s in symbols:
+            self._flush(s, self._feeds[s])
+
+    def _flush(self, symbol, feed):
+        if feed.handle is not None:
+            feed.handle.cancel()
+            feed.handle = None
+
+        pending, feed.pending = feed.pending, []
+        spot, feed.spot = feed.spot, None
+        timestamp, feed.timestamp = feed.timestamp, None
+        if not pending and spot is None and timestamp is None:
+            return
+
+        started = time.perf_counter()
+        chain = feed.chain
+        dirty = pd.DatetimeIndex([])
+
+        # one apply_updates per run of ticks with the same columns;
+        # later ticks on a contract win
+        i = 0
+        while i < len(pending):
+            cols = list(pending[i].columns)
+            j = i + 1
+            while j < len(pending) and list(pending[j].columns) == cols:
+                j += 1
+            batch = pd.concat(pending[i:j], ignore_index=True) \
+                if j - i > 1 else pending[i]
+            batch = batch.drop_duplicates(SORT_KEYS, keep="last")
+            dirty = dirty.union(self._apply(symbol, feed, batch))
+            i = j
+
+        if spot is not None:
+            chain.underlying = spot
+        if timestamp is not None:
+            chain.timestamp = pd.Timestamp(timestamp)
+
+        # spot/timestamp feed every expiry's metrics; cached nodes make
+        # clean expiries cheap
+        expiries = chain.expiries() if spot is not None or \
+            timestamp is not None else dirty
+        feed.flushes += 1
+        self._recompute(symbol, feed, expiries, emit=True)
+        self.last_flush_seconds = time.perf_counter() - started
+
+    def _apply(self, symbol, feed, batch):
+        """
+        Apply one batch of ticks, setting aside contracts the chain does
+        not list (recorded under errors[(symbol, "updates")]) so the
+        valid ticks in the window still land.
+        """
+        try:
+            rows = feed.chain.locate(batch)
+            unknown = rows < 0
+            if unknown.any():
+                bad = batch.loc[unknown, SORT_KEYS].values.tolist()
+                self.errors[(symbol, "updates")] = KeyError(
+                    f"Contracts not in chain: {bad}"
+                )
+                feed.rejected += len(bad)
+                batch = batch.loc[~unknown]
+            if batch.empty:
+                return pd.DatetimeIndex([])
+            return feed.chain.apply_updates(batch)
+        except (KeyError, ValueError, TypeError) as exc:
+            # malformed ticks (bad columns or labels) are dropped as a batch
+            self.errors[(symbol, "updates")] = exc
+            feed.rejected += len(batch)
+            return pd.DatetimeIndex([])
+
+    # ---------- compute ----------
+
+    def _recompute(self, symbol, feed, expiries, emit):
+        for expiry in expiries:
+            try:
+                new = _compute_metrics(feed.chain, expiry, feed.context)
+            except Exception as exc:  # keep streaming other expiries
+                self.errors[(symbol, expiry)] = exc
+                continue
+            self.errors.pop((symbol, expiry), None)
+
+            delta = _delta(feed.metrics.get(expiry), new)
+            feed.metrics[expiry] = new
+            if not emit or not delta:
+                continue
+
+            update = MetricUpdate(
+                symbol=symbol,
+                expiry=expiry,
+                timestamp=feed.chain.timestamp,
+                metrics=new,
+                delta=delta,
+            )
+            for callback in self.callbacks:
+                callback(update)
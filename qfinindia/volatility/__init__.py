@@ -1,2 +1,3 @@
 from .smile import VolSmile
 from .surface import VolSurface
+from .svi import SVICalibrator, SVISlice, calibrate_svi, svi_total_variance
@@ -1,34 +1,74 @@
 import numpy as np
+from scipy.linalg import solve_triangular
 
 
 class SurfaceAnalytics:
     """
     Quantitative analytics on implied volatility surface.
+
+    iv_surface is (maturities x strikes), or a stack of such surfaces
+    (e.g. time x maturities x strikes); results keep the leading axes.
+    Missing quotes may be NaN. Optional weights (per strike or per
+    point) scale the squared residuals of the polynomial fits.
     """
 
-    def __init__(self, strikes, maturities, iv_surface, spot):
+    def __init__(self, strikes, maturities, iv_surface, spot, weights=None):
         self.strikes = np.array(strikes)
         self.maturities = np.array(maturities)
         self.iv = np.array(iv_surface)
         self.spot = spot
+        self.weights = None if weights is None else np.asarray(weights)
+
+    # ---------- batched polynomial fit ----------
+
+    def _leading_coefficient(self, deg, moneyness=False):
+        """
+        Leading coefficient of a degree-deg least-squares polynomial in
+        strike (or log-moneyness) for every surface row at once.
+
+        The fit runs on a standardized axis so one Vandermonde/QR is
+        shared by all rows; rows with NaNs or weights fall back to
+        batched weighted normal equations. Rows with too few points
+        give NaN.
+        """
+        x = np.log(self.strikes / self.spot) if moneyness \
+            else self.strikes.astype(float)
+        scale = x.std() or 1.0
+        V = np.vander((x - x.mean()) / scale, deg + 1)
+
+        n = x.size
+        Y = self.iv.reshape(-1, n).astype(float)
+        mask = np.isfinite(Y)
+
+        if self.weights is None and mask.all():
+            Q, R = np.linalg.qr(V)
+            coef = solve_triangular(R, Q.T @ Y.T)[0]
+        else:
+            W = mask if self.weights is None else \
+                mask * np.broadcast_to(self.weights, self.iv.shape).reshape(-1, n)
+            Y0 = np.where(mask, Y, 0.0)
+
+            A = np.einsum("rn,ni,nj->rij", W, V, V)
+            b = np.einsum("rn,ni->ri", W * Y0, V)
+
+            ok = np.count_nonzero(W > 0, axis=1) > deg
+            A[~ok] = np.eye(deg + 1)
+            b[~ok] = 0.0
+
+            coef = np.linalg.solve(A, b[..., None])[:, 0, 0]
+            coef = np.where(ok, coef, np.nan)
+
+        return (coef / scale**deg).reshape(self.iv.shape[:-1])
 
     # ---------- ATM term structure ----------
     def atm_term_structure(self):
         idx = np.argmin(np.abs(self.strikes - self.spot))
-        return self.maturities, self.iv[:, idx]
+        return self.maturities, self.iv[..., idx]
 
     # ---------- skew slope ----------
-    def skew(self):
-        slopes = []
-        for row in self.iv:
-            slope = np.polyfit(self.strikes, row, 1)[0]
-            slopes.append(slope)
-        return self.maturities, np.array(slopes)
+    def skew(self, moneyness=False):
+        return self.maturities, self._leading_coefficient(1, moneyness)
 
     # ---------- curvature ----------
-    def curvature(self):
-        curv = []
-        for row in self.iv:
-            quad = np.polyfit(self.strikes, row, 2)[0]
-            curv.append(quad)
-        return self.maturities, np.array(curv)
+    def curvature(self, moneyness=False):
+        return self.maturities, self._leading_coefficient(2, moneyness)
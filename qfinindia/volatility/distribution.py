@@ -1,32 +1,113 @@
 import numpy as np
+from scipy.integrate import cumulative_trapezoid
+
+
+def _col(x):
+    """
+    Per-distribution values as a trailing column, to broadcast on the grid.
+    """
+    return np.expand_dims(x, -1)
+
+
+def _at(arr, idx):
+    """
+    arr[..., idx] with one index per stacked row.
+    """
+    arr = np.asarray(arr)
+    if arr.ndim == 1:
+        return arr[idx]
+    idx = np.broadcast_to(idx, arr.shape[:-1])
+    return np.take_along_axis(arr, _col(idx), axis=-1)[..., 0]
 
 
 class Distribution:
+    """
+    Implied distribution on a strike grid.
+
+    density may be stacked (N distributions x grid) with strikes either
+    a shared grid or one grid per row; moments then come back per row.
+
+    All moments derive from one cached pass over raw moments 0-4, taken
+    about `center` (mid-grid) to limit cancellation.
+    """
 
     def __init__(self, strikes, density):
         self.strikes = strikes
-        self.density = density / np.trapz(density, strikes)
+        self.density = density / _col(np.trapz(density, strikes))
+
+        strikes = np.asarray(strikes)
+        self.center = 0.5 * (strikes[..., 0] + strikes[..., -1])
+
+        self._raw = None
+        self._cumulative = None
 
     @classmethod
     def from_rnd(cls, rnd):
         return cls(rnd.strikes, rnd.density)
 
+    # ---------- moment engine ----------
+
+    def _powers(self):
+        x = self.strikes - _col(self.center)
+        k = np.arange(5).reshape((5,) + (1,) * np.ndim(self.density))
+        return x**k * self.density
+
+    def raw_moments(self, cumulative=False):
+        """
+        Integrals of (x - center)^k * density for k = 0..4.
+
+        Returns shape (5, ...) or, with cumulative=True, the running
+        integrals from the left edge with shape (5, ..., grid).
+        """
+        if cumulative:
+            if self._cumulative is None:
+                y = self._powers()
+                self._cumulative = cumulative_trapezoid(
+                    y, np.broadcast_to(self.strikes, y.shape),
+                    axis=-1, initial=0,
+                )
+            return self._cumulative
+
+        if self._raw is None:
+            if self._cumulative is not None:
+                self._raw = self._cumulative[..., -1]
+            else:
+                self._raw = np.trapz(self._powers(), self.strikes, axis=-1)
+        return self._raw
+
+    def moments(self):
+        """
+        mean, variance, std, skew and kurtosis from the cached raw moments.
+        """
+        m0, m1, m2, m3, m4 = self.raw_moments()
+        m1, m2, m3, m4 = m1 / m0, m2 / m0, m3 / m0, m4 / m0
+
+        var = m2 - m1**2
+        mu3 = m3 - 3 * m1 * m2 + 2 * m1**3
+        mu4 = m4 - 4 * m1 * m3 + 6 * m1**2 * m2 - 3 * m1**4
+        std = np.sqrt(var)
+
+        return {
+            "mean": self.center + m1,
+            "variance": var,
+            "std": std,
+            "skew": mu3 / std**3,
+            "kurtosis": mu4 / var**2,
+        }
+
+    # ---------- moments ----------
+
     def mean(self):
-        return np.trapz(self.strikes * self.density, self.strikes)
+        return self.moments()["mean"]
 
     def variance(self):
-        m = self.mean()
-        return np.trapz((self.strikes - m)**2 * self.density, self.strikes)
+        return self.moments()["variance"]
 
     def std(self):
-        return np.sqrt(self.variance())
+        return self.moments()["std"]
 
     def skew(self):
-        m = self.mean()
-        s = self.std()
-        return np.trapz(((self.strikes - m)/s)**3 * self.density, self.strikes)
+        return self.moments()["skew"]
 
     def kurtosis(self):
-        m = self.mean()
-        s = self.std()
-        return np.trapz(((self.strikes - m)/s)**4 * self.density, self.strikes)
+        return self.moments()["kurtosis"]
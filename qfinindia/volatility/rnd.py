@@ -1,42 +1,199 @@
 import numpy as np
+import pandas as pd
 from scipy.interpolate import CubicSpline
 
 
+GRID_POLICIES = ("uniform", "log", "adaptive")
+
+
+def _density(spline, x):
+    # Breeden-Litzenberger: second derivative of the price curve
+    return np.maximum(spline(x, 2), 0)
+
+
+def _interval_error(spline, grid, f, stats=None):
+    """
+    Per-interval |Simpson - trapezoid| estimate and the midpoints used.
+
+    With stats (mass, mean, std) the integrand is weighted by
+    1 + z^2, so intervals that matter for the variance are refined too.
+    """
+    mid = 0.5 * (grid[1:] + grid[:-1])
+    fm = _density(spline, mid)
+
+    if stats is not None:
+        _, mean, std = stats
+        f = f * (1 + ((grid - mean) / std)**2)
+        fm = fm * (1 + ((mid - mean) / std)**2)
+
+    err = np.diff(grid) / 3 * np.abs(2 * fm - f[:-1] - f[1:])
+    return err, mid, fm
+
+
+def _moments(grid, f):
+    mass = np.trapz(f, grid)
+    mean = np.trapz(grid * f, grid) / mass
+    std = np.sqrt(np.trapz((grid - mean)**2 * f, grid) / mass)
+    return np.array([mass, mean, std])
+
+
+def _adaptive_grid(spline, lo, hi, n, tol, max_points):
+    """
+    Refine intervals with above-average local error until mass, mean
+    and std change by less than tol (mass absolute; mean/std relative
+    to std) or max_points is reached.
+    """
+    grid = np.linspace(lo, hi, n)
+    f = _density(spline, grid)
+    stats = _moments(grid, f)
+
+    while True:
+        err, mid, _ = _interval_error(spline, grid, f, stats)
+        refine = err > err.mean()
+        if grid.size + refine.sum() > max_points or not refine.any():
+            break
+
+        new = mid[refine]
+        grid = np.concatenate([grid, new])
+        f = np.concatenate([f, _density(spline, new)])
+        order = np.argsort(grid, kind="mergesort")
+        grid, f = grid[order], f[order]
+
+        prev, stats = stats, _moments(grid, f)
+        change = np.abs(stats - prev) / np.array([1.0, stats[2], stats[2]])
+        if np.all(change < tol):
+            break
+
+    err, _, _ = _interval_error(spline, grid, f)
+    return grid, f, err
+
 class RND:
+    """
+    Risk-neutral density on a strike grid.
 
-    def __init__(self, strikes, density):
+    For batch builds density is (expiry x grid) and strikes is either the
+    shared grid (N,) or one aligned grid per expiry (E, N).
+    """
+
+    def __init__(self, strikes, density, expiries=None,
+                 error_estimate=None):
         self.strikes = strikes
         self.density = density
+        self.expiries = expiries
+        self.error_estimate = error_estimate
+
+    @property
+    def grid_size(self):
+        return np.shape(self.strikes)[-1]
 
     @classmethod
-    def from_chain(cls, chain, expiry, option_type="C"):
-        sub = chain.expiry(expiry)
+    def from_chain(cls, chain, expiry, option_type="C", grid="uniform",
+                   n=200, tol=1e-4, max_points=4096):
+        """
+        Breeden-Litzenberger density for one expiry.
 
+        grid : {"uniform", "log", "adaptive"} or array_like
+            uniform  - n evenly spaced strikes (default, 200 points)
+            log      - n points evenly spaced in log-moneyness
+            adaptive - start from n points and bisect high-error
+                       intervals until mass/mean/std move less than tol
+            array    - explicit strike grid
+        error_estimate on the result is the estimated absolute error of
+        the integrated probability mass (Simpson vs trapezoid).
+        """
         if option_type == "C":
-            sub = sub.calls()
+            sub = chain.calls(expiry)
         else:
-            sub = sub.puts()
+            sub = chain.puts(expiry)
 
-        df = sub.to_dataframe().sort_values("strike")
+        # chain slices are already strike-sorted views
+        df = sub.data
 
-        K = df["strike"].values
-        C = df["price"].values
+        K = df["strike"].to_numpy(dtype=float)
+        C = df["price"].to_numpy(dtype=float)
 
         # spline price curve
         spline = CubicSpline(K, C)
 
-        # second derivative (Breeden-Litzenberger)
-        K_grid = np.linspace(K.min(), K.max(), 200)
-        second_deriv = spline(K_grid, 2)
+        if isinstance(grid, str):
+            if grid not in GRID_POLICIES:
+                raise ValueError(f"grid must be one of {GRID_POLICIES} or an array")
+            if grid == "adaptive":
+                K_grid, density, err = _adaptive_grid(
+                    spline, K.min(), K.max(), n, tol, max_points
+                )
+                return cls(K_grid, density, error_estimate=float(err.sum()))
+            if grid == "log":
+                K_grid = np.exp(np.linspace(np.log(K.min()), np.log(K.max()), n))
+            else:
+                K_grid = np.linspace(K.min(), K.max(), n)
+        else:
+            K_grid = np.asarray(grid, dtype=float)
+
+        density = _density(spline, K_grid)
+        err, _, _ = _interval_error(spline, K_grid, density)
+
+        return cls(K_grid, density, error_estimate=float(err.sum()))
+
+    @classmethod
+    def from_chain_batch(cls, chain, expiries=None, option_type="C",
+                         n=200, grid="shared"):
+        """
+        Densities for many expiries as one (expiry x grid) matrix.
+
+        grid="shared": one grid over the union strike range; each row is
+            zero outside its own quoted strikes, so rows are directly
+            comparable.
+        grid="aligned": each row on its own linspace over its strikes,
+            matching RND.from_chain row by row.
+
+        Expiries quoted on identical strikes are fitted together as one
+        multi-column spline.
+        """
+        if grid not in ("shared", "aligned"):
+            raise ValueError("grid must be 'shared' or 'aligned'")
+
+        expiries = chain.expiries() if expiries is None \
+            else pd.DatetimeIndex(expiries)
+
+        legs = [
+            (chain.calls(e) if option_type == "C" else chain.puts(e)).data
+            for e in expiries
+        ]
+        Ks = [leg["strike"].to_numpy(dtype=float) for leg in legs]
+        Cs = [leg["price"].to_numpy(dtype=float) for leg in legs]
+
+        groups = {}
+        for i, K in enumerate(Ks):
+            groups.setdefault(K.tobytes(), []).append(i)
+
+        if grid == "shared":
+            K_grid = np.linspace(min(K.min() for K in Ks),
+                                 max(K.max() for K in Ks), n)
+        else:
+            K_grid = np.empty((len(expiries), n))
+        density = np.zeros((len(expiries), n))
+
+        for rows in groups.values():
+            K = Ks[rows[0]]
+            spline = CubicSpline(K, np.column_stack([Cs[i] for i in rows]))
+
+            if grid == "shared":
+                cols = np.flatnonzero((K_grid >= K[0]) & (K_grid <= K[-1]))
+                density[np.ix_(rows, cols)] = spline(K_grid[cols], 2).T
+            else:
+                g = np.linspace(K.min(), K.max(), n)
+                K_grid[rows] = g
+                density[rows] = spline(g, 2).T
 
-        density = np.maximum(second_deriv, 0)
+        density = np.maximum(density, 0)
 
-        return cls(K_grid, density)
+        return cls(K_grid, density, expiries=expiries)
 
     def plot(self):
         import matplotlib.pyplot as plt
         plt.figure(figsize=(6,4))
-        plt.plot(self.strikes, self.density)
+        plt.plot(np.transpose(self.strikes), np.transpose(self.density))
         plt.xlabel("Strike")
         plt.ylabel("Density")
         plt.title("Risk-Neutral Density")
@@ -1,9 +1,14 @@
 import numpy as np
+from scipy.integrate import cumulative_trapezoid
 
 
 class ScenarioAnalytics:
     """
     Market-implied scenario probabilities from risk-neutral density.
+
+    Cumulative probability and first-moment integrals are built once, so
+    every query is an interpolated lookup and accepts array levels. On
+    grid points the results equal trapz over the matching strike mask.
     """
 
     def __init__(self, strikes, density, spot):
@@ -14,29 +19,77 @@ class ScenarioAnalytics:
         # normalize
         self.f = self.f / np.trapz(self.f, self.K)
 
+        # cumulative integrals of f and K * f from the left edge
+        self._F = cumulative_trapezoid(self.f, self.K, initial=0)
+        self._M = cumulative_trapezoid(self.K * self.f, self.K, initial=0)
+
+    # ---------- cumulative lookups ----------
+
+    def _cumulative(self, level, strict=False):
+        """
+        (F, M) integrated up to level. With strict=True a level sitting
+        on a grid point stops at the previous node, matching K < level.
+        """
+        level = np.asarray(level, dtype=float)
+        F = np.interp(level, self.K, self._F)
+        M = np.interp(level, self.K, self._M)
+
+        if strict:
+            i = np.searchsorted(self.K, level, side="left")
+            hit = (i < len(self.K)) & \
+                (self.K[np.minimum(i, len(self.K) - 1)] == level)
+            prev = np.maximum(i - 1, 0)
+            F = np.where(hit, np.where(i > 0, self._F[prev], 0.0), F)
+            M = np.where(hit, np.where(i > 0, self._M[prev], 0.0), M)
+
+        return F, M
+
+    def _tail(self, level, strict=False):
+        """
+        (F, M) integrated from level to the right edge. With strict=True a
+        level on a grid point starts at the next node, matching K > level.
+        """
+        level = np.asarray(level, dtype=float)
+        F = np.interp(level, self.K, self._F)
+        M = np.interp(level, self.K, self._M)
+
+        if strict:
+            i = np.searchsorted(self.K, level, side="left")
+            hit = (i < len(self.K)) & \
+                (self.K[np.minimum(i, len(self.K) - 1)] == level)
+            nxt = np.minimum(i + 1, len(self.K) - 1)
+            F = np.where(hit, self._F[nxt], F)
+            M = np.where(hit, self._M[nxt], M)
+
+        return self._F[-1] - F, self._M[-1] - M
+
+    # ---------- probabilities ----------
+
     def prob_below(self, level):
-        mask = self.K <= level
-        return np.trapz(self.f[mask], self.K[mask])
+        return self._cumulative(level)[0][()]
 
     def prob_above(self, level):
-        mask = self.K >= level
-        return np.trapz(self.f[mask], self.K[mask])
+        return self._tail(level)[0][()]
 
     def prob_between(self, low, high):
-        mask = (self.K >= low) & (self.K <= high)
-        return np.trapz(self.f[mask], self.K[mask])
-
-    def expected_move_down(self):
-        mask = self.K < self.spot
-        prob = np.trapz(self.f[mask], self.K[mask])
-        exp = np.trapz((self.spot - self.K[mask]) * self.f[mask], self.K[mask])
-        return exp / prob if prob > 0 else 0
-
-    def expected_move_up(self):
-        mask = self.K > self.spot
-        prob = np.trapz(self.f[mask], self.K[mask])
-        exp = np.trapz((self.K[mask] - self.spot) * self.f[mask], self.K[mask])
-        return exp / prob if prob > 0 else 0
+        prob = self._cumulative(high)[0] - self._cumulative(low)[0]
+        return np.maximum(prob, 0.0)[()]
+
+    # ---------- conditional moves ----------
+
+    def expected_move_down(self, level=None):
+        level = self.spot if level is None else level
+        prob, first = self._cumulative(level, strict=True)
+        exp = np.asarray(level) * prob - first
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(prob > 0, exp / prob, 0)[()]
+
+    def expected_move_up(self, level=None):
+        level = self.spot if level is None else level
+        prob, first = self._tail(level, strict=True)
+        exp = first - np.asarray(level) * prob
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(prob > 0, exp / prob, 0)[()]
     
     def tail_asymmetry(self):
         """
@@ -53,4 +106,3 @@ class ScenarioAnalytics:
         down = self.expected_move_down()
         up = self.expected_move_up()
         return down / up if up > 0 else np.inf
-
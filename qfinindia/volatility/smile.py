@@ -12,17 +12,12 @@ class VolSmile:
 
     @classmethod
     def from_chain(cls, chain, expiry=None, option_type="C"):
-        sub = chain
-
-        if expiry is not None:
-            sub = sub.expiry(expiry)
-
         if option_type == "C":
-            sub = sub.calls()
+            sub = chain.calls(expiry)
         else:
-            sub = sub.puts()
+            sub = chain.puts(expiry)
 
-        df = sub.to_dataframe().dropna(subset=["iv"])
+        df = sub.data.dropna(subset=["iv"])
 
         return cls(
             strikes=df["strike"].values,
@@ -1,10 +1,185 @@
+import numpy as np
+import pandas as pd
+
+from qfinindia.options.batch import year_fraction
+from qfinindia.volatility.svi import otm_quotes
+
+
 class VolSurface:
+    """
+    Implied-vol surface on a total-variance grid over (log-moneyness, T).
+
+    The grid is built lazily on the first query: one row per expiry,
+    each OTM smile interpolated onto a shared uniform k = log(K / F)
+    axis. iv(K, T) is then bilinear (linear in k, linear in total
+    variance along T) with flat-vol extrapolation, fully vectorized.
+    """
 
-    def __init__(self, df, underlying=None):
+    def __init__(self, df, underlying=None, rate=0.0, time=None,
+                 forwards=None, n=201):
         self.df = df
         self.underlying = underlying
+        self.rate = rate
+        self.n = n
+
+        self._time = time
+        self._forwards = forwards
+        self.timestamp = None
+
+        self.expiries = None
+        self.times = None
+        self.forwards = None
+        self.k_grid = None
+        self.w = None
 
     @classmethod
-    def from_chain(cls, chain):
-        df = chain.to_dataframe().dropna(subset=["iv"])
-        return cls(df, chain.underlying)
+    def from_chain(cls, chain, rate=0.0, time=None, forwards=None, n=201):
+        """
+        time and forwards may be scalars or {expiry: value} mappings;
+        by default T comes from chain.timestamp and F = S exp(rT).
+        """
+        df = chain.data.dropna(subset=["iv"])
+        surface = cls(df, chain.underlying, rate, time, forwards, n)
+        surface.timestamp = chain.timestamp
+        return surface
+
+    # ---------- grid ----------
+
+    def _slice_inputs(self, expiry, df):
+        """
+        (T, F, k, w) for one expiry's rows.
+        """
+        T = self._time.get(expiry) if isinstance(self._time, dict) \
+            else self._time
+        if T is None:
+            T = float(year_fraction(expiry, self.timestamp)[0])
+
+        F = self._forwards.get(expiry) if isinstance(self._forwards, dict) \
+            else self._forwards
+        if F is None:
+            if self.underlying is None:
+                raise ValueError("underlying is required for the surface")
+            F = float(self.underlying) * np.exp(self.rate * T)
+
+        K, iv = otm_quotes(df, F)
+        return float(T), float(F), np.log(K / F), iv * iv * T
+
+    def _row(self, k, w):
+        # flat total variance outside the quoted strikes
+        return np.interp(self.k_grid, k, w)
+
+    def _build(self):
+        slices = []
+        for expiry, df in self.df.groupby("expiry", sort=True, observed=True):
+            T, F, k, w = self._slice_inputs(pd.Timestamp(expiry), df)
+            if T > 0 and len(k) >= 2:
+                slices.append((pd.Timestamp(expiry), T, F, k, w))
+
+        if not slices:
+            raise ValueError("No expiry has enough IV quotes for a surface")
+
+        lo = min(s[3][0] for s in slices)
+        hi = max(s[3][-1] for s in slices)
+        self.k_grid = np.linspace(lo, hi, self.n)
+
+        self.expiries = pd.DatetimeIndex([s[0] for s in slices])
+        self.times = np.array([s[1] for s in slices])
+        self.forwards = np.array([s[2] for s in slices])
+        self.w = np.vstack([self._row(s[3], s[4]) for s in slices])
+
+    def _ensure(self):
+        if self.w is None:
+            self._build()
+
+    def update_slice(self, chain, expiry):
+        """
+        Rebuild one expiry row from chain (e.g. after apply_updates),
+        keeping the k axis; the expiry is added or dropped as needed.
+        """
+        self._ensure()
+        expiry = pd.Timestamp(expiry)
+
+        df = chain.expiry(expiry).data
+        df = df[np.isfinite(df["iv"].to_numpy(dtype=float))]
+        self.df = pd.concat(
+            [self.df[self.df["expiry"] != expiry], df]
+        )
+        self.underlying = chain.underlying
+
+        pos = self.expiries.get_indexer([expiry])[0]
+        if pos >= 0:
+            keep = np.arange(len(self.times)) != pos
+            self.expiries = self.expiries[keep]
+            self.times = self.times[keep]
+            self.forwards = self.forwards[keep]
+            self.w = self.w[keep]
+
+        T, F, k, w = self._slice_inputs(expiry, df)
+        if T <= 0 or len(k) < 2:
+            return self
+
+        i = np.searchsorted(self.times, T)
+        self.expiries = self.expiries.insert(i, expiry)
+        self.times = np.insert(self.times, i, T)
+        self.forwards = np.insert(self.forwards, i, F)
+        self.w = np.insert(self.w, i, self._row(k, w), axis=0)
+        return self
+
+    # ---------- queries ----------
+
+    def forward(self, time):
+        """
+        Forward at arbitrary T: log-linear between expiries, carried at
+        the rate beyond the first and last one.
+        """
+        self._ensure()
+        T = np.asarray(time, dtype=float)
+        logf = np.log(self.forwards)
+
+        out = np.interp(T, self.times, logf)
+        out = np.where(T < self.times[0],
+                       logf[0] + self.rate * (T - self.times[0]), out)
+        out = np.where(T > self.times[-1],
+                       logf[-1] + self.rate * (T - self.times[-1]), out)
+        return np.exp(out)
+
+    def total_variance(self, strike, time):
+        self._ensure()
+        K, T = np.broadcast_arrays(
+            np.asarray(strike, dtype=float), np.asarray(time, dtype=float)
+        )
+        k = np.log(K / self.forward(T))
+
+        # k axis: uniform grid, so the cell index is arithmetic
+        g = self.k_grid
+        x = np.clip((k - g[0]) / (g[1] - g[0]), 0, len(g) - 1)
+        i = np.minimum(x.astype(np.intp), len(g) - 2)
+        u = x - i
+
+        # T axis: linear in total variance between expiries, flat vol
+        # (w scaled with T) outside the quoted maturities
+        times = self.times
+        last = len(times) - 1
+        j = np.searchsorted(times, T)
+        j1 = np.minimum(j, last)
+        j0 = np.where(j > last, last, np.maximum(j - 1, 0))
+
+        w0 = self.w[j0, i] * (1 - u) + self.w[j0, i + 1] * u
+        w1 = self.w[j1, i] * (1 - u) + self.w[j1, i + 1] * u
+
+        t0, t1 = times[j0], times[j1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v = np.where(t1 > t0, (T - t0) / (t1 - t0), 0.0)
+            scale = np.where(T < times[0], T / times[0],
+                             np.where(T > times[-1], T / times[-1], 1.0))
+        w = (w0 + v * (w1 - w0)) * scale
+        return w[()]
+
+    def iv(self, strike, time):
+        """
+        Implied vol at arbitrary (strike, T) points; inputs broadcast.
+        """
+        w = self.total_variance(strike, time)
+        T = np.asarray(time, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(np.maximum(w, 0.0) / T)[()]
@@ -0,0 +1,261 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from scipy.optimize import least_squares
+
+from qfinindia.options.batch import year_fraction
+
+
+SVI_PARAMS = ("a", "b", "rho", "m", "sigma")
+
+_RHO_MAX = 0.999
+_SIGMA_MIN = 1e-4
+
+# weight of the w_min >= 0 residual relative to the quote residuals,
+# and the shortfall still treated as zero variance
+_PENALTY = 1e3
+_VARIANCE_TOL = 1e-10
+
+
+# ---------- raw SVI ----------
+
+def svi_total_variance(k, params):
+    """
+    Raw SVI total variance w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + sigma^2)).
+
+    k is log-moneyness log(K / F); params has shape (..., 5) and
+    broadcasts against k.
+    """
+    a, b, rho, m, sigma = np.moveaxis(np.asarray(params, dtype=float), -1, 0)
+    d = np.asarray(k, dtype=float) - m
+    return a + b * (rho * d + np.sqrt(d * d + sigma * sigma))
+
+
+def svi_jacobian(k, params):
+    """
+    Analytic d w / d (a, b, rho, m, sigma), shape k.shape + (5,).
+    """
+    a, b, rho, m, sigma = params
+    d = np.asarray(k, dtype=float) - m
+    s = np.sqrt(d * d + sigma * sigma)
+
+    return np.stack([
+        np.ones_like(d),
+        rho * d + s,
+        b * d,
+        -b * (rho + d / s),
+        b * sigma / s,
+    ], axis=-1)
+
+
+def svi_min_variance(params):
+    """
+    Minimum of w(k) over all k: a + b sigma sqrt(1 - rho^2).
+    """
+    a, b, rho, m, sigma = np.moveaxis(np.asarray(params, dtype=float), -1, 0)
+    return a + b * sigma * np.sqrt(1.0 - rho * rho)
+
+
+def _bounds(k, w):
+    """
+    Box constraints: b in [0, 2] (Lee's wing bound on total variance),
+    |rho| < 1, sigma > 0, m within twice the quoted moneyness range.
+    a may go negative; non-negative minimum variance is enforced by a
+    penalty residual in calibrate_svi.
+    """
+    span = max(np.ptp(k), 1e-3)
+    lo = np.array([-np.max(w), 0.0, -_RHO_MAX, k.min() - span, _SIGMA_MIN])
+    hi = np.array([np.max(w), 2.0, _RHO_MAX, k.max() + span, 2.0 * span])
+    return lo, hi
+
+
+def _initial_guess(k, w):
+    i = np.argmin(w)
+    return np.array([w[i], 0.1, -0.3, k[i], 0.1])
+
+
+def calibrate_svi(k, w, x0=None, weights=None, penalty=_PENALTY, **kw):
+    """
+    Least-squares fit of one raw SVI slice to total variances w at
+    log-moneyness k, with vectorized residuals and analytic Jacobian.
+
+    One extra residual, penalty * max(0, -w_min), pushes the fit towards
+    non-negative total variance everywhere (see svi_min_variance).
+
+    x0 warm-starts the optimizer (clipped into the bounds); extra
+    keyword arguments go to scipy.optimize.least_squares.
+
+    Returns
+    -------
+    scipy.optimize.OptimizeResult
+    """
+    k = np.asarray(k, dtype=float)
+    w = np.asarray(w, dtype=float)
+    sw = np.ones_like(w) if weights is None else \
+        np.sqrt(np.asarray(weights, dtype=float))
+
+    lo, hi = _bounds(k, w)
+    x0 = _initial_guess(k, w) if x0 is None else np.asarray(x0, dtype=float)
+    x0 = np.clip(x0, lo + 1e-12, hi - 1e-12)
+
+    scale = penalty * np.sqrt(np.sum(sw * sw))
+
+    def residuals(p):
+        floor = scale * max(0.0, -svi_min_variance(p))
+        return np.append(sw * (svi_total_variance(k, p) - w), floor)
+
+    def jacobian(p):
+        a, b, rho, m, sigma = p
+        q = np.sqrt(1.0 - rho * rho)
+        grad = np.zeros(5)
+        if svi_min_variance(p) < 0:
+            grad[:] = -scale * np.array(
+                [1.0, sigma * q, -b * sigma * rho / q, 0.0, b * q]
+            )
+        return np.vstack([sw[:, None] * svi_jacobian(k, p), grad])
+
+    kw.setdefault("x_scale", "jac")
+    return least_squares(residuals, x0, jac=jacobian, bounds=(lo, hi), **kw)
+
+
+def otm_quotes(df, forward):
+    """
+    (strike, iv) of OTM quotes with IV, sorted by strike: puts below the
+    forward, calls at or above it.
+    """
+    K = df["strike"].to_numpy(dtype=float)
+    iv = df["iv"].to_numpy(dtype=float)
+    is_put = (df["type"] == "P").to_numpy()
+
+    keep = np.isfinite(iv) & (iv > 0) & ((K < forward) == is_put)
+    order = np.argsort(K[keep], kind="stable")
+    return K[keep][order], iv[keep][order]
+
+
+# ---------- slices ----------
+
+@dataclass
+class SVISlice:
+    """
+    Calibrated SVI smile for one expiry.
+
+    admissible is False when the fit implies negative total variance
+    near m (the floor penalty could not hold); iv is NaN there.
+    """
+    expiry: pd.Timestamp
+    time: float
+    forward: float
+    params: np.ndarray
+    rmse: float
+    converged: bool
+    min_variance: float
+
+    @property
+    def admissible(self):
+        return self.min_variance >= -_VARIANCE_TOL
+
+    def total_variance(self, strike):
+        k = np.log(np.asarray(strike, dtype=float) / self.forward)
+        return svi_total_variance(k, self.params)
+
+    def iv(self, strike):
+        w = self.total_variance(strike)
+        w = np.where(w >= -_VARIANCE_TOL, np.maximum(w, 0.0), np.nan)
+        return np.sqrt(w / self.time)
+
+    def to_dict(self):
+        return dict(zip(SVI_PARAMS, self.params))
+
+
+class SVICalibrator:
+    """
+    Calibrates SVI slices for every expiry of a chain.
+
+    Parameters from the last calibration are kept per expiry and reused
+    as the starting point next time, so recalibrating a streaming chain
+    only takes a few optimizer iterations per expiry.
+    """
+
+    def __init__(self, rate=0.0, min_points=5, **lsq_options):
+        self.rate = rate
+        self.min_points = min_points
+        self.lsq_options = lsq_options
+        self.params = {}
+
+    def calibrate_slice(self, chain, expiry, time=None, forward=None):
+        """
+        Fit one expiry; returns SVISlice, or None when too few quotes
+        or the expiry has already passed (T <= 0).
+        """
+        if "iv" not in chain.data.columns:
+            raise ValueError("IV column missing")
+
+        expiry = pd.Timestamp(expiry)
+        if time is None:
+            time = float(year_fraction(expiry, chain.timestamp)[0])
+        if time <= 0:
+            return None
+
+        if forward is None:
+            if chain.underlying is None:
+                raise ValueError("chain.underlying is required for SVI")
+            forward = float(chain.underlying) * np.exp(self.rate * time)
+
+        K, iv = otm_quotes(chain.expiry(expiry).data, forward)
+        if len(K) < self.min_points:
+            return None
+
+        k = np.log(K / forward)
+        w = iv * iv * time
+
+        res = calibrate_svi(
+            k, w, x0=self.params.get(expiry), **self.lsq_options
+        )
+        self.params[expiry] = res.x
+
+        return SVISlice(
+            expiry=expiry,
+            time=time,
+            forward=forward,
+            params=res.x,
+            rmse=float(np.sqrt(np.mean(res.fun[:-1] ** 2))),
+            converged=bool(res.success),
+            min_variance=float(svi_min_variance(res.x)),
+        )
+
+    def calibrate(self, chain, expiries=None, time=None, forwards=None):
+        """
+        Fit every expiry (or the given ones).
+
+        time and forwards may be scalars or {expiry: value} mappings.
+
+        Returns
+        -------
+        dict[pandas.Timestamp, SVISlice]
+        """
+        expiries = chain.expiries() if expiries is None else \
+            pd.to_datetime(np.atleast_1d(expiries))
+
+        def pick(value, expiry):
+            if isinstance(value, dict):
+                return value.get(expiry)
+            return value
+
+        out = {}
+        for expiry in expiries:
+            fit = self.calibrate_slice(
+                chain, expiry,
+                time=pick(time, expiry),
+                forward=pick(forwards, expiry),
+            )
+            if fit is not None:
+                out[expiry] = fit
+        return out
+
+    def to_dataframe(self):
+        """
+        Latest parameters per expiry.
+        """
+        return pd.DataFrame.from_dict(
+            self.params, orient="index", columns=list(SVI_PARAMS)
+        ).sort_index()
@@ -1,33 +1,117 @@
 import numpy as np
+from scipy.integrate import cumulative_trapezoid
+
+from qfinindia.volatility.distribution import _at, _col
 
 
 class TailRisk:
+    """
+    Quantile-based tail metrics; accepts stacked densities like
+    Distribution and then returns one value per row.
+
+    The trapezoid CDF and the partial first moment are built once, so
+    VaR/ES for any number of alphas are interpolated lookups.
+    """
 
     def __init__(self, strikes, density):
+        """
+        Rows with zero or non-finite total mass get NaN metrics.
+        """
         self.strikes = strikes
-        self.density = density / np.trapz(density, strikes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.density = density / _col(np.trapz(density, strikes))
+
+            x = np.broadcast_to(strikes, self.density.shape)
+            self._x = x
+            self.cdf = cumulative_trapezoid(
+                self.density, x, axis=-1, initial=0
+            )
+            self.partial_mean = cumulative_trapezoid(
+                x * self.density, x, axis=-1, initial=0
+            )
+
+            total = self.cdf[..., -1:]
+            self.cdf = self.cdf / total
+            self.partial_mean = self.partial_mean / total
+
+        # flat row mask of massless rows (NaN CDF)
+        self._massless = ~np.isfinite(
+            self.cdf.reshape(-1, self.cdf.shape[-1])
+        ).all(axis=-1)
 
     @classmethod
     def from_distribution(cls, dist):
         return cls(dist.strikes, dist.density)
 
+    def _inverse(self, alpha):
+        """
+        Segment index and interpolation weight where the CDF crosses
+        each alpha, from a single searchsorted over all rows.
+
+        Output shape is density.shape[:-1] + alpha.shape.
+        """
+        alpha = np.asarray(alpha, dtype=float)
+        cdf = self.cdf.reshape(-1, self.cdf.shape[-1])
+        rows, n = cdf.shape
+
+        # massless rows have a NaN CDF, which would break the sorted
+        # search for every row: search a placeholder, answer NaN
+        bad = self._massless
+        if bad.any():
+            cdf = np.where(bad[:, None], np.linspace(0.0, 1.0, n), cdf)
+
+        # rows live in disjoint bands [2r, 2r + 1], so one sorted array
+        offset = 2.0 * np.arange(rows)
+        flat = (cdf + offset[:, None]).ravel()
+        q = alpha.reshape(1, -1) + offset[:, None]
+        pos = np.searchsorted(flat, q, side="left") - \
+            (np.arange(rows) * n)[:, None]
+
+        hi = np.clip(pos, 1, n - 1)
+        lo = hi - 1
+        f0 = np.take_along_axis(cdf, lo, axis=-1)
+        f1 = np.take_along_axis(cdf, hi, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip((alpha.reshape(1, -1) - f0) / (f1 - f0), 0.0, 1.0)
+        t = np.where(f1 > f0, t, 1.0)
+        if bad.any():
+            t = np.where(bad[:, None], np.nan, t)
+
+        shape = self.cdf.shape[:-1] + alpha.shape
+        return lo, hi, t, shape
+
+    def _interp(self, table, lo, hi, t, shape):
+        table = table.reshape(-1, table.shape[-1])
+        v0 = np.take_along_axis(table, lo, axis=-1)
+        v1 = np.take_along_axis(table, hi, axis=-1)
+        return (v0 + t * (v1 - v0)).reshape(shape)[()]
+
     def var(self, alpha=0.05):
-        cdf = np.cumsum(self.density)
-        cdf /= cdf[-1]
-        idx = np.searchsorted(cdf, alpha)
-        return self.strikes[idx]
+        """
+        Strike level at cumulative probability alpha (scalar or array).
+        """
+        lo, hi, t, shape = self._inverse(alpha)
+        return self._interp(self._x, lo, hi, t, shape)
 
     def expected_shortfall(self, alpha=0.05):
-        var_level = self.var(alpha)
-        mask = self.strikes <= var_level
-        prob = np.trapz(self.density[mask], self.strikes[mask])
-        loss = np.trapz(self.strikes[mask] * self.density[mask], self.strikes[mask])
-        return loss / prob if prob > 0 else np.nan
+        """
+        Mean strike below the alpha quantile (scalar or array alpha).
+        """
+        lo, hi, t, shape = self._inverse(alpha)
+        loss = self._interp(self.partial_mean, lo, hi, t, shape)
+        prob = self._interp(self.cdf, lo, hi, t, shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(prob > 0, loss / prob, np.nan)[()]
 
     def downside_probability(self, spot):
-        mask = self.strikes < spot
-        return np.trapz(self.density[mask], self.strikes[mask])
+        # strikes < spot
+        n = np.sum(np.asarray(self.strikes) < spot, axis=-1)
+        prob = _at(self.cdf, np.maximum(n - 1, 0))
+        return np.where(n > 0, prob, 0.0)[()]
 
     def upside_probability(self, spot):
-        mask = self.strikes >= spot
-        return np.trapz(self.density[mask], self.strikes[mask])
+        # strikes >= spot
+        n = np.sum(np.asarray(self.strikes) < spot, axis=-1)
+        last = np.shape(self.density)[-1] - 1
+        prob = _at(self.cdf, last) - _at(self.cdf, np.minimum(n, last))
+        return np.where(n <= last, prob, 0.0)[()]
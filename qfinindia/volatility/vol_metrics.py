@@ -3,19 +3,18 @@ import numpy as np
 
 class VolMetrics:
 
-    def __init__(self, chain):
+    def __init__(self, chain, expiry=None, context=None):
+        from qfinindia.context import AnalyticsContext
+
         self.chain = chain
-        self.df = chain.to_dataframe()
+        self.context = context if context is not None \
+            else AnalyticsContext(chain)
+        self.expiry = self.context.resolve_expiry(expiry)
+        self.df = chain.expiry(self.expiry).data
 
     def forward(self):
-        # mean of RND already best proxy
-        from qfinindia.volatility.distribution import Distribution
-        from qfinindia.volatility.rnd import RND
-
-        expiry = self.df["expiry"].iloc[0]
-        rnd = RND.from_chain(self.chain, expiry)
-        dist = Distribution.from_rnd(rnd)
-        return dist.mean()
+        # put-call parity forward (RND mean fallback), memoized in the context
+        return self.context.forward(self.expiry)
 
     def atm_strike(self):
         fwd = self.forward()
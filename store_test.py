@@ -0,0 +1,41 @@
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from qfinindia import SyntheticChain
+from qfinindia.data import SnapshotStore
+
+
+def test_store_read_apply_updates():
+    """
+    store -> read -> apply_updates patches the chain, not the files.
+    """
+    with tempfile.TemporaryDirectory() as root:
+        store = SnapshotStore(root)
+        chain = SyntheticChain(
+            24000, "2026-01-29", strike_range=(23000, 25000, 100), T=0.06
+        ).build()
+        chain.timestamp = pd.Timestamp("2026-01-07 10:00")
+        store.append(chain, "NIFTY")
+
+        read = next(store.read("NIFTY"))
+        expiry = read.expiries()[0]
+        changed = read.apply_updates({
+            "expiry": [expiry], "type": ["C"], "strike": [24000],
+            "price": [1.5],
+        })
+
+        def price(c):
+            df = c.data
+            return df.loc[(df["strike"] == 24000) & (df["type"] == "C"),
+                          "price"].iloc[0]
+
+        assert list(changed) == [expiry]
+        assert price(read) == 1.5
+        assert np.isclose(price(next(store.read("NIFTY"))), price(chain))
+
+
+if __name__ == "__main__":
+    test_store_read_apply_updates()
+    print("store round trip ok")